@@ -1,9 +1,30 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from abc import ABC, abstractmethod
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from multiprocessing import shared_memory
+import mmap
+import os
+import queue
 import random
+import struct
 import time
 import threading
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from scipy import ndimage
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
 try:
     import tkinter as tk
     from tkinter import ttk, messagebox
@@ -12,37 +33,199 @@ except ImportError:
     GUI_AVAILABLE = False
 
 
+LABEL_TYPECODES = ("B", "H", "I", "L", "Q")
+DEFAULT_TILE_THRESHOLD = 1 << 20
+DEFAULT_BAND_ROWS = 256
+GRID_FILE_MAGIC = b"GRID"
+GRID_FILE_HEADER = struct.Struct("<4sQQcB10x")
+DEFAULT_FRAME_MS = 33
+DEFAULT_FRAME_BUDGET = 5000
+DEFAULT_ANIMATION_DELAY = 0.05
+IMAGE_MODE_CELLS = 2500
+MAX_CANVAS_WIDTH = 760
+MAX_CANVAS_HEIGHT = 400
+
+
+def label_typecode(max_value: int) -> str:
+    for typecode in LABEL_TYPECODES:
+        if max_value < 1 << (8 * array(typecode).itemsize):
+            return typecode
+    raise OverflowError(f"Nenhum tipo de array sem sinal comporta o valor {max_value}")
+
+
 class Grid:
-    def __init__(self, rows: int, cols: int, data: List[List[int]]):
+    def __init__(self, rows: int, cols: int, data: Optional[List[List[int]]] = None,
+                 max_label: int = 1, cells=None):
+        if rows <= 0 or cols <= 0:
+            raise ValueError("As dimensões devem ser positivas")
         self.rows = rows
         self.cols = cols
-        self.data = data
+        
+        if cells is not None:
+            if len(cells) != rows * cols:
+                raise ValueError(f"O buffer deve ter exatamente {rows * cols} células")
+            self.cells = cells
+            return
+        
+        if data is None:
+            typecode = label_typecode(max_label)
+            self.cells = array(typecode, bytes(rows * cols * array(typecode).itemsize))
+            return
+        
+        if len(data) != rows or any(len(row) != cols for row in data):
+            raise ValueError(f"A grade deve ter {rows} linhas com {cols} elementos cada")
+        if min(min(row) for row in data) < 0:
+            raise ValueError("Os valores da grade devem ser não negativos")
+        max_value = max(max_label, max(max(row) for row in data))
+        self.cells = array(label_typecode(max_value), chain.from_iterable(data))
+    
+    @classmethod
+    def from_buffer(cls, rows: int, cols: int, cells) -> "Grid":
+        return cls(rows, cols, cells=cells)
+    
+    def to_list(self) -> List[List[int]]:
+        return [self.cells[i * self.cols:(i + 1) * self.cols].tolist() for i in range(self.rows)]
+    
+    @property
+    def data(self) -> Tuple[Tuple[int, ...], ...]:
+        return tuple(tuple(row) for row in self.to_list())
+    
+    @property
+    def typecode(self) -> str:
+        return self.cells.typecode if isinstance(self.cells, array) else self.cells.format.lstrip("@")
+    
+    def buffer(self) -> memoryview:
+        return memoryview(self.cells)
+    
+    def row_view(self, x: int) -> memoryview:
+        return memoryview(self.cells)[x * self.cols:(x + 1) * self.cols]
+    
+    def as_numpy(self):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy não está instalado")
+        return np.asarray(memoryview(self.cells)).reshape(self.rows, self.cols)
     
     def is_valid_position(self, x: int, y: int) -> bool:
         return 0 <= x < self.rows and 0 <= y < self.cols
     
     def get_value(self, x: int, y: int) -> int:
-        if self.is_valid_position(x, y):
-            return self.data[x][y]
+        if 0 <= x < self.rows and 0 <= y < self.cols:
+            return self.cells[x * self.cols + y]
         return -1
     
     def set_value(self, x: int, y: int, value: int):
-        if self.is_valid_position(x, y):
-            self.data[x][y] = value
+        if 0 <= x < self.rows and 0 <= y < self.cols:
+            try:
+                self.cells[x * self.cols + y] = value
+            except (OverflowError, ValueError):
+                self.widen(value)
+                self.cells[x * self.cols + y] = value
+    
+    def widen(self, max_value: int):
+        if max_value < 0:
+            raise ValueError("Os valores da grade devem ser não negativos")
+        if not isinstance(self.cells, array):
+            if max_value >= 1 << (8 * self.cells.itemsize):
+                raise OverflowError(f"O buffer externo ({self.typecode}) não comporta o valor {max_value}")
+            return
+        typecode = label_typecode(max_value)
+        if array(typecode).itemsize > self.cells.itemsize:
+            self.cells = array(typecode, self.cells)
     
     def display(self):
-        for row in self.data:
+        for row in self.to_list():
             print(' '.join(map(str, row)))
         print()
     
-    def find_next_navigable_cell(self) -> Tuple[int, int]:
-        for i in range(self.rows):
-            for j in range(self.cols):
-                if self.data[i][j] == 0:
-                    return (i, j)
+    def find_next_navigable_cell(self, start: int = 0) -> Tuple[int, int]:
+        if isinstance(self.cells, array):
+            try:
+                return divmod(self.cells.index(0, start), self.cols)
+            except ValueError:
+                return (-1, -1)
+        for index in range(start, len(self.cells)):
+            if self.cells[index] == 0:
+                return divmod(index, self.cols)
         return (-1, -1)
 
 
+class GridFile:
+    def __init__(self, path: str, writable: bool = True):
+        self.path = path
+        self.grid = None
+        self.mapping = None
+        self._raw = None
+        self._cells = None
+        self.file = open(path, "r+b" if writable else "rb")
+        try:
+            size = os.fstat(self.file.fileno()).st_size
+            if size < GRID_FILE_HEADER.size:
+                raise ValueError(f"{path} não é um arquivo de grade: cabeçalho incompleto")
+            self.mapping = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+            
+            magic, rows, cols, typecode, itemsize = GRID_FILE_HEADER.unpack_from(self.mapping)
+            typecode = typecode.decode("ascii", "replace")
+            if magic != GRID_FILE_MAGIC:
+                raise ValueError(f"{path} não é um arquivo de grade")
+            if typecode not in LABEL_TYPECODES or array(typecode).itemsize != itemsize:
+                raise ValueError(f"Tipo de célula não suportado em {path}: {typecode} ({itemsize} bytes)")
+            if rows <= 0 or cols <= 0:
+                raise ValueError(f"Dimensões inválidas em {path}: {rows}x{cols}")
+            body = rows * cols * itemsize
+            if size < GRID_FILE_HEADER.size + body:
+                raise ValueError(f"{path} está truncado: esperados {body} bytes de células, "
+                                 f"encontrados {size - GRID_FILE_HEADER.size}")
+            
+            self._raw = memoryview(self.mapping)[GRID_FILE_HEADER.size:GRID_FILE_HEADER.size + body]
+            self._cells = self._raw.cast(typecode)
+            self.grid = Grid.from_buffer(rows, cols, self._cells)
+        except BaseException:
+            self.close()
+            raise
+    
+    @classmethod
+    def create(cls, path: str, rows: int, cols: int, typecode: str = "I") -> "GridFile":
+        if rows <= 0 or cols <= 0:
+            raise ValueError("As dimensões devem ser positivas")
+        itemsize = array(typecode).itemsize
+        with open(path, "wb") as f:
+            f.write(GRID_FILE_HEADER.pack(GRID_FILE_MAGIC, rows, cols, typecode.encode("ascii"), itemsize))
+            f.truncate(GRID_FILE_HEADER.size + rows * cols * itemsize)
+        return cls(path)
+    
+    @staticmethod
+    def save(path: str, grid: Grid, typecode: str = "I"):
+        if typecode not in LABEL_TYPECODES:
+            raise ValueError(f"Tipo de célula não suportado: {typecode}")
+        itemsize = array(typecode).itemsize
+        with open(path, "wb") as f:
+            f.write(GRID_FILE_HEADER.pack(GRID_FILE_MAGIC, grid.rows, grid.cols, typecode.encode("ascii"), itemsize))
+            if grid.typecode == typecode:
+                f.write(grid.buffer())
+                return
+            for x in range(grid.rows):
+                f.write(array(typecode, grid.row_view(x)))
+    
+    def flush(self):
+        self.mapping.flush()
+    
+    def close(self):
+        self.grid = None
+        for view in (self._cells, self._raw):
+            if view is not None:
+                view.release()
+        self._cells = self._raw = None
+        if self.mapping is not None and not self.mapping.closed:
+            self.mapping.close()
+        self.file.close()
+    
+    def __enter__(self) -> "GridFile":
+        return self
+    
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
 class FloodFillStrategy(ABC):
     @abstractmethod
     def fill(self, grid: Grid, start_x: int, start_y: int, color: int):
@@ -87,24 +270,651 @@ class IterativeFloodFill(FloodFillStrategy):
                 stack.append((x + dx, y + dy))
 
 
+class ScanlineFloodFill(FloodFillStrategy):
+    def fill(self, grid: Grid, start_x: int, start_y: int, color: int):
+        if grid.get_value(start_x, start_y) != 0:
+            return
+        
+        grid.widen(color)
+        cells = grid.cells
+        rows, cols = grid.rows, grid.cols
+        fill_block = array(grid.typecode, [color]) if isinstance(cells, array) else None
+        stack = [(start_x, start_y)]
+        
+        while stack:
+            x, y = stack.pop()
+            row_start = x * cols
+            if cells[row_start + y] != 0:
+                continue
+            
+            left = y
+            while left > 0 and cells[row_start + left - 1] == 0:
+                left -= 1
+            right = y
+            while right < cols - 1 and cells[row_start + right + 1] == 0:
+                right += 1
+            
+            if fill_block is not None:
+                cells[row_start + left:row_start + right + 1] = fill_block * (right - left + 1)
+            else:
+                for index in range(row_start + left, row_start + right + 1):
+                    cells[index] = color
+            
+            for nx in (x - 1, x + 1):
+                if not 0 <= nx < rows:
+                    continue
+                neighbour_start = nx * cols
+                in_span = False
+                for ny in range(left, right + 1):
+                    if cells[neighbour_start + ny] == 0:
+                        if not in_span:
+                            stack.append((nx, ny))
+                            in_span = True
+                    else:
+                        in_span = False
+
+
+CONNECTIVITIES = (4, 8)
+
+
+class Region:
+    def __init__(self, color: int, seed: Tuple[int, int], size: int,
+                 bounds: Tuple[int, int, int, int]):
+        self.color = color
+        self.seed = seed
+        self.size = size
+        self.bounds = bounds
+    
+    def __repr__(self) -> str:
+        return f"Region(color={self.color}, seed={self.seed}, size={self.size}, bounds={self.bounds})"
+
+
+class RegionLabeler(ABC):
+    def __init__(self, connectivity: int = 4):
+        if connectivity not in CONNECTIVITIES:
+            raise ValueError(f"Conectividade deve ser uma de {CONNECTIVITIES}")
+        self.connectivity = connectivity
+    
+    def label(self, grid: Grid, first_color: int) -> List[Tuple[int, int]]:
+        return [region.seed for region in self.label_regions(grid, first_color)]
+    
+    @abstractmethod
+    def label_regions(self, grid: Grid, first_color: int) -> List[Region]:
+        pass
+
+
+class TwoPassLabeler(RegionLabeler):
+    def label_regions(self, grid: Grid, first_color: int) -> List[Region]:
+        runs, parent = self._scan_runs(grid)
+        
+        component = [0] * len(parent)
+        regions = []
+        for run_id in range(len(parent)):
+            root = self._find(parent, run_id)
+            if root == run_id:
+                x, left, _ = runs[run_id]
+                component[run_id] = len(regions)
+                regions.append(Region(first_color + len(regions), (x, left), 0, (x, left, x, left)))
+            else:
+                component[run_id] = component[root]
+        
+        if regions:
+            grid.widen(first_color + len(regions) - 1)
+        cells = grid.cells
+        cols = grid.cols
+        blocks = {}
+        for run_id, (x, left, right) in enumerate(runs):
+            region = regions[component[run_id]]
+            color = region.color
+            length = right - left + 1
+            start = x * cols + left
+            if isinstance(cells, array):
+                block = blocks.get(color)
+                if block is None:
+                    block = blocks[color] = array(grid.typecode, [color])
+                cells[start:start + length] = block * length
+            else:
+                for index in range(start, start + length):
+                    cells[index] = color
+            
+            min_x, min_y, max_x, max_y = region.bounds
+            region.size += length
+            region.bounds = (min_x, min(min_y, left), max(max_x, x), max(max_y, right))
+        return regions
+    
+    def _scan_runs(self, grid: Grid) -> Tuple[List[Tuple[int, int, int]], List[int]]:
+        cells = grid.cells
+        cols = grid.cols
+        runs = []
+        parent = []
+        previous = []
+        for x in range(grid.rows):
+            current = []
+            for left, right in self._row_runs(cells, x * cols, cols):
+                run_id = len(runs)
+                runs.append((x, left, right))
+                parent.append(run_id)
+                current.append((left, right, run_id))
+            self._link_runs(parent, previous, current)
+            previous = current
+        return runs, parent
+    
+    @staticmethod
+    def _row_runs(cells, row_start: int, cols: int) -> List[Tuple[int, int]]:
+        runs = []
+        y = 0
+        while y < cols:
+            if cells[row_start + y] != 0:
+                y += 1
+                continue
+            left = y
+            while y < cols and cells[row_start + y] == 0:
+                y += 1
+            runs.append((left, y - 1))
+        return runs
+    
+    def _link_runs(self, parent, previous: List[Tuple[int, int, int]], current: List[Tuple[int, int, int]]):
+        reach = 1 if self.connectivity == 8 else 0
+        i = j = 0
+        while i < len(previous) and j < len(current):
+            above_left, above_right, above_id = previous[i]
+            left, right, run_id = current[j]
+            if above_right >= left - reach and right + reach >= above_left:
+                self._union(parent, above_id, run_id)
+            if above_right < right + reach:
+                i += 1
+            else:
+                j += 1
+    
+    @staticmethod
+    def _find(parent: List[int], node: int) -> int:
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+    
+    @classmethod
+    def _union(cls, parent: List[int], a: int, b: int):
+        root_a = cls._find(parent, a)
+        root_b = cls._find(parent, b)
+        if root_a < root_b:
+            parent[root_b] = root_a
+        elif root_b < root_a:
+            parent[root_a] = root_b
+
+
+class StreamingLabeler(TwoPassLabeler):
+    def __init__(self, connectivity: int = 4, band_rows: int = DEFAULT_BAND_ROWS):
+        super().__init__(connectivity)
+        if band_rows <= 0:
+            raise ValueError("A faixa deve ter pelo menos uma linha")
+        self.band_rows = band_rows
+    
+    def label_regions(self, grid: Grid, first_color: int) -> List[Region]:
+        parent = array("Q")
+        previous = []
+        for band_start, band in self._bands(grid):
+            for offset in range(len(band) // grid.cols):
+                current = []
+                for left, right in self._row_runs(band, offset * grid.cols, grid.cols):
+                    current.append((left, right, len(parent)))
+                    parent.append(len(parent))
+                self._link_runs(parent, previous, current)
+                previous = current
+        
+        roots = sum(1 for run_id, root in enumerate(parent) if run_id == root)
+        if roots:
+            grid.widen(first_color + roots - 1)
+        
+        regions = []
+        region_of_root = {}
+        run_id = 0
+        for band_start, band in self._bands(grid):
+            spans = []
+            for offset in range(len(band) // grid.cols):
+                x = band_start + offset
+                for left, right in self._row_runs(band, offset * grid.cols, grid.cols):
+                    root = self._find(parent, run_id)
+                    region = region_of_root.get(root)
+                    if region is None:
+                        region = region_of_root[root] = Region(first_color + len(regions), (x, left), 0,
+                                                               (x, left, x, right))
+                        regions.append(region)
+                    else:
+                        min_x, min_y, max_x, max_y = region.bounds
+                        region.bounds = (min_x, min(min_y, left), max(max_x, x), max(max_y, right))
+                    region.size += right - left + 1
+                    spans.append((offset * grid.cols + left, right - left + 1, region.color))
+                    run_id += 1
+            if spans:
+                self._write_band(grid, band_start, band, spans)
+        return regions
+    
+    def _bands(self, grid: Grid):
+        for band_start in range(0, grid.rows, self.band_rows):
+            band_stop = min(band_start + self.band_rows, grid.rows)
+            yield band_start, array(grid.typecode, grid.cells[band_start * grid.cols:band_stop * grid.cols])
+    
+    @staticmethod
+    def _write_band(grid: Grid, band_start: int, band: array, spans: List[Tuple[int, int, int]]):
+        typecode = grid.typecode
+        if band.typecode != typecode:
+            band = array(typecode, band)
+        for start, length, color in spans:
+            band[start:start + length] = array(typecode, [color]) * length
+        start = band_start * grid.cols
+        grid.cells[start:start + len(band)] = band
+
+
+def _label_tile(shm_name: str, typecode: str, cols: int, row_start: int, row_stop: int,
+                connectivity: int, first_label: int) -> List[Tuple[int, ...]]:
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        with shm.buf.cast(typecode) as values, values[row_start * cols:row_stop * cols] as tile:
+            local = array(typecode, tile)
+            regions = TwoPassLabeler(connectivity).label_regions(
+                Grid.from_buffer(row_stop - row_start, cols, local), first_label)
+            tile[:] = local
+    finally:
+        shm.close()
+    return [(region.seed[0] + row_start, region.seed[1], region.size,
+             region.bounds[0] + row_start, region.bounds[1], region.bounds[2] + row_start, region.bounds[3])
+            for region in regions]
+
+
+def _paint_tile(shm_name: str, typecode: str, cols: int, row_start: int, row_stop: int,
+                first_label: int, colors: List[int]):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        with shm.buf.cast(typecode) as values, values[row_start * cols:row_stop * cols] as tile:
+            tile[:] = array(typecode, [colors[value - first_label] if value >= first_label else value
+                                       for value in tile])
+    finally:
+        shm.close()
+
+
+class TiledLabeler(TwoPassLabeler):
+    def __init__(self, connectivity: int = 4, workers: Optional[int] = None,
+                 tile_rows: Optional[int] = None, threshold: int = DEFAULT_TILE_THRESHOLD):
+        super().__init__(connectivity)
+        self.workers = workers or os.cpu_count() or 1
+        self.tile_rows = tile_rows
+        self.threshold = threshold
+    
+    def label_regions(self, grid: Grid, first_color: int) -> List[Region]:
+        if grid.rows * grid.cols < self.threshold or grid.rows < 2:
+            return super().label_regions(grid, first_color)
+        
+        tile_rows = self.tile_rows or -(-grid.rows // self.workers)
+        bounds = [(start, min(start + tile_rows, grid.rows)) for start in range(0, grid.rows, tile_rows)]
+        first_label = max(grid.cells) + 1
+        typecode = label_typecode(max(first_label + tile_rows * grid.cols, first_color + grid.rows * grid.cols))
+        nbytes = grid.rows * grid.cols * array(typecode).itemsize
+        
+        shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+        try:
+            with shm.buf.cast(typecode) as values:
+                for start, stop in self._copy_bands(grid):
+                    values[start:stop] = array(typecode, grid.cells[start:stop])
+            with ProcessPoolExecutor(self.workers) as pool:
+                futures = [pool.submit(_label_tile, shm.name, typecode, grid.cols, start, stop,
+                                       self.connectivity, first_label) for start, stop in bounds]
+                tiles = [future.result() for future in futures]
+                
+                offsets = [0]
+                for tile in tiles:
+                    offsets.append(offsets[-1] + len(tile))
+                parent = list(range(offsets[-1]))
+                self._merge_borders(shm, typecode, grid.cols, bounds, offsets, first_label, parent)
+                regions, colors = self._renumber(tiles, parent, first_color)
+                
+                futures = [pool.submit(_paint_tile, shm.name, typecode, grid.cols, start, stop,
+                                       first_label, colors[offsets[index]:offsets[index + 1]])
+                           for index, (start, stop) in enumerate(bounds)]
+                for future in futures:
+                    future.result()
+            
+            if regions:
+                grid.widen(regions[-1].color)
+            with shm.buf.cast(typecode) as values:
+                for start, stop in self._copy_bands(grid):
+                    grid.cells[start:stop] = array(grid.typecode, values[start:stop])
+        finally:
+            shm.close()
+            shm.unlink()
+        return regions
+    
+    @staticmethod
+    def _copy_bands(grid: Grid):
+        step = DEFAULT_BAND_ROWS * grid.cols
+        total = grid.rows * grid.cols
+        for start in range(0, total, step):
+            yield start, min(start + step, total)
+    
+    def _merge_borders(self, shm: shared_memory.SharedMemory, typecode: str, cols: int,
+                       bounds: List[Tuple[int, int]], offsets: List[int], first_label: int, parent: List[int]):
+        reach = 1 if self.connectivity == 8 else 0
+        with shm.buf.cast(typecode) as values:
+            for index in range(1, len(bounds)):
+                border = bounds[index][0] * cols
+                above = values[border - cols:border].tolist()
+                below = values[border:border + cols].tolist()
+                for y, label_above in enumerate(above):
+                    if label_above < first_label:
+                        continue
+                    for ny in range(max(0, y - reach), min(cols, y + reach + 1)):
+                        if below[ny] >= first_label:
+                            self._union(parent, offsets[index - 1] + label_above - first_label,
+                                        offsets[index] + below[ny] - first_label)
+    
+    def _renumber(self, tiles: List[List[Tuple[int, ...]]], parent: List[int],
+                  first_color: int) -> Tuple[List[Region], List[int]]:
+        regions = []
+        colors = [0] * len(parent)
+        label = 0
+        for tile in tiles:
+            for seed_x, seed_y, size, min_x, min_y, max_x, max_y in tile:
+                root = self._find(parent, label)
+                if root == label:
+                    region = Region(first_color + len(regions), (seed_x, seed_y), size, (min_x, min_y, max_x, max_y))
+                    regions.append(region)
+                else:
+                    region = regions[colors[root] - first_color]
+                    region.size += size
+                    bounds = region.bounds
+                    region.bounds = (bounds[0], min(bounds[1], min_y), max(bounds[2], max_x), max(bounds[3], max_y))
+                colors[label] = region.color
+                label += 1
+        return regions, colors
+
+
+class VectorizedLabeler(RegionLabeler):
+    def __init__(self, connectivity: int = 4, use_scipy: bool = True):
+        super().__init__(connectivity)
+        self.use_scipy = use_scipy
+        self.fallback = TwoPassLabeler(connectivity)
+    
+    def label_regions(self, grid: Grid, first_color: int) -> List[Region]:
+        if not NUMPY_AVAILABLE:
+            return self.fallback.label_regions(grid, first_color)
+        
+        mask = grid.as_numpy() == 0
+        if self.use_scipy and SCIPY_AVAILABLE:
+            return self._label_ndimage(grid, mask, first_color)
+        return self._label_runs(grid, mask, first_color)
+    
+    def _label_ndimage(self, grid: Grid, mask, first_color: int) -> List[Region]:
+        structure = ndimage.generate_binary_structure(2, 1 if self.connectivity == 4 else 2)
+        labels, count = ndimage.label(mask, structure)
+        if count == 0:
+            return []
+        
+        flat_labels = labels.reshape(-1)
+        flat_mask = mask.reshape(-1)
+        grid.widen(first_color + count - 1)
+        grid.as_numpy().reshape(-1)[flat_mask] = flat_labels[flat_mask] + (first_color - 1)
+        
+        running_max = np.maximum.accumulate(flat_labels)
+        seeds = np.flatnonzero(flat_labels[1:] > running_max[:-1]) + 1
+        if flat_labels[0]:
+            seeds = np.concatenate(([0], seeds))
+        seed_rows, seed_cols = np.divmod(seeds, grid.cols)
+        sizes = np.bincount(flat_labels, minlength=count + 1)[1:]
+        
+        regions = []
+        for index, (rows, cols) in enumerate(ndimage.find_objects(labels)):
+            regions.append(Region(first_color + index, (int(seed_rows[index]), int(seed_cols[index])),
+                                  int(sizes[index]), (rows.start, cols.start, rows.stop - 1, cols.stop - 1)))
+        return regions
+    
+    def _label_runs(self, grid: Grid, mask, first_color: int) -> List[Region]:
+        rows, cols = mask.shape
+        padded = np.zeros((rows, cols + 2), dtype=np.int8)
+        padded[:, 1:-1] = mask
+        edges = np.diff(padded, axis=1)
+        run_rows, starts = np.nonzero(edges == 1)
+        ends = np.nonzero(edges == -1)[1]
+        count = len(starts)
+        if count == 0:
+            return []
+        
+        width = cols + 2
+        reach = 1 if self.connectivity == 8 else 0
+        above = (run_rows - 1) * width
+        low = np.searchsorted(run_rows * width + ends, above + starts - reach, side="right")
+        high = np.searchsorted(run_rows * width + starts, above + ends + reach, side="left")
+        overlaps = np.maximum(high - low, 0)
+        current = np.repeat(np.arange(count), overlaps)
+        previous = np.repeat(low, overlaps) + np.arange(len(current)) - np.repeat(np.cumsum(overlaps) - overlaps, overlaps)
+        
+        parent = self._merge_runs(np.arange(count), previous, current)
+        roots = parent == np.arange(count)
+        component = (np.cumsum(roots) - 1)[parent]
+        regions_count = int(roots.sum())
+        
+        lengths = ends - starts
+        grid.widen(first_color + regions_count - 1)
+        grid.as_numpy().reshape(-1)[mask.reshape(-1)] = np.repeat(component + first_color, lengths)
+        
+        first = np.flatnonzero(roots)
+        sizes = np.bincount(component, weights=lengths, minlength=regions_count).astype(np.int64)
+        max_rows = run_rows[first].copy()
+        min_cols = starts[first].copy()
+        max_cols = ends[first] - 1
+        np.maximum.at(max_rows, component, run_rows)
+        np.minimum.at(min_cols, component, starts)
+        np.maximum.at(max_cols, component, ends - 1)
+        
+        return [Region(first_color + index, (seed_row, seed_col), size, (seed_row, min_col, max_row, max_col))
+                for index, (seed_row, seed_col, size, min_col, max_row, max_col) in enumerate(zip(
+                    run_rows[first].tolist(), starts[first].tolist(), sizes.tolist(),
+                    min_cols.tolist(), max_rows.tolist(), max_cols.tolist()))]
+    
+    @staticmethod
+    def _merge_runs(parent, previous, current):
+        while len(previous):
+            root_a = parent[previous]
+            root_b = parent[current]
+            pending = root_a != root_b
+            previous, current = previous[pending], current[pending]
+            root_a, root_b = root_a[pending], root_b[pending]
+            if not len(previous):
+                break
+            np.minimum.at(parent, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+            while True:
+                compressed = parent[parent]
+                if np.array_equal(compressed, parent):
+                    break
+                parent = compressed
+        return parent
+
+
 class TerrainMapper:
-    def __init__(self, strategy: FloodFillStrategy):
+    def __init__(self, strategy: FloodFillStrategy, labeler: RegionLabeler = None):
         self.strategy = strategy
+        self.labeler = labeler
         self.current_color = 2
+        self.regions = []
     
     def fill_region(self, grid: Grid, start_x: int, start_y: int):
         self.strategy.fill(grid, start_x, start_y, self.current_color)
         self.current_color += 1
     
-    def map_all_regions(self, grid: Grid):
+    def map_all_regions(self, grid: Grid, on_region=None) -> int:
+        if self.labeler is not None:
+            self.regions = self.labeler.label_regions(grid, self.current_color)
+            for region in self.regions:
+                if on_region:
+                    on_region(grid, region.seed[0], region.seed[1], region.color)
+            self.current_color += len(self.regions)
+            return len(self.regions)
+        
+        count = 0
+        cursor = 0
         while True:
-            next_x, next_y = grid.find_next_navigable_cell()
+            next_x, next_y = grid.find_next_navigable_cell(cursor)
             if next_x == -1:
                 break
             
-            print(f"Preenchendo região iniciando em ({next_x}, {next_y}) com cor {self.current_color}")
+            color = self.current_color
             self.fill_region(grid, next_x, next_y)
-            grid.display()
+            if on_region:
+                on_region(grid, next_x, next_y, color)
+            cursor = next_x * grid.cols + next_y + 1
+            count += 1
+        return count
+    
+    @staticmethod
+    def print_region(grid: Grid, x: int, y: int, color: int):
+        print(f"Preenchendo região iniciando em ({x}, {y}) com cor {color}")
+        grid.display()
+
+
+class DynamicRegionIndex:
+    def __init__(self, grid: Grid, connectivity: int = 4, labeler: RegionLabeler = None):
+        if connectivity not in CONNECTIVITIES:
+            raise ValueError(f"Conectividade deve ser uma de {CONNECTIVITIES}")
+        self.grid = grid
+        if connectivity == 4:
+            self.directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+        else:
+            self.directions = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+        
+        existing = max(grid.cells)
+        if grid.find_next_navigable_cell()[0] != -1:
+            labeler = labeler or TwoPassLabeler(connectivity)
+            labeler.label_regions(grid, max(existing, 1) + 1)
+        self.sizes = Counter(grid.cells)
+        self.sizes.pop(1, None)
+        self.next_color = max(max(grid.cells), 1) + 1
+    
+    def region_of(self, x: int, y: int) -> Optional[int]:
+        value = self.grid.get_value(x, y)
+        return value if value > 1 else None
+    
+    def same_region(self, a: Tuple[int, int], b: Tuple[int, int]) -> bool:
+        color = self.region_of(*a)
+        return color is not None and color == self.region_of(*b)
+    
+    def region_size(self, x: int, y: int) -> int:
+        color = self.region_of(x, y)
+        return self.sizes[color] if color is not None else 0
+    
+    def region_count(self) -> int:
+        return len(self.sizes)
+    
+    def remove_obstacle(self, x: int, y: int):
+        if self.grid.get_value(x, y) != 1:
+            return
+        
+        neighbours = {}
+        for nx, ny in self._neighbours(x, y):
+            color = self.grid.get_value(nx, ny)
+            if color > 1:
+                neighbours.setdefault(color, (nx, ny))
+        
+        if not neighbours:
+            color = self._new_color()
+        else:
+            color = max(neighbours, key=lambda neighbour: self.sizes[neighbour])
+            for other, (nx, ny) in neighbours.items():
+                if other != color:
+                    self._recolor(self._collect(nx, ny, other), color)
+                    del self.sizes[other]
+        self.grid.set_value(x, y, color)
+        self.sizes[color] += 1
+    
+    def add_obstacle(self, x: int, y: int):
+        color = self.region_of(x, y)
+        if color is None:
+            return
+        
+        self.grid.set_value(x, y, 1)
+        self.sizes[color] -= 1
+        if not self.sizes[color]:
+            del self.sizes[color]
+            return
+        
+        seeds = [(nx, ny) for nx, ny in self._neighbours(x, y) if self.grid.get_value(nx, ny) == color]
+        if len(seeds) > 1:
+            for piece in self._split_pieces(seeds, color):
+                self._recolor(piece, self._new_color())
+    
+    def _neighbours(self, x: int, y: int):
+        for dx, dy in self.directions:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.grid.rows and 0 <= ny < self.grid.cols:
+                yield nx, ny
+    
+    def _new_color(self) -> int:
+        color = self.next_color
+        self.next_color += 1
+        return color
+    
+    def _collect(self, x: int, y: int, color: int) -> List[Tuple[int, int]]:
+        cells = [(x, y)]
+        seen = {(x, y)}
+        for cx, cy in cells:
+            for cell in self._neighbours(cx, cy):
+                if cell not in seen and self.grid.get_value(*cell) == color:
+                    seen.add(cell)
+                    cells.append(cell)
+        return cells
+    
+    def _recolor(self, cells: List[Tuple[int, int]], color: int):
+        old = self.grid.get_value(*cells[0])
+        for x, y in cells:
+            self.grid.set_value(x, y, color)
+        self.sizes[old] -= len(cells)
+        if not self.sizes[old]:
+            del self.sizes[old]
+        self.sizes[color] += len(cells)
+    
+    def _split_pieces(self, seeds: List[Tuple[int, int]], color: int) -> List[List[Tuple[int, int]]]:
+        owner = {seed: index for index, seed in enumerate(seeds)}
+        group = list(range(len(seeds)))
+        frontiers = {index: [seed] for index, seed in enumerate(seeds)}
+        members = {index: [seed] for index, seed in enumerate(seeds)}
+        
+        def find(index: int) -> int:
+            while group[index] != index:
+                group[index] = group[group[index]]
+                index = group[index]
+            return index
+        
+        pieces = []
+        while len(frontiers) > 1:
+            for index in list(frontiers):
+                if index not in frontiers:
+                    continue
+                frontier = frontiers[index]
+                if not frontier:
+                    pieces.append(members.pop(index))
+                    del frontiers[index]
+                    continue
+                cx, cy = frontier.pop()
+                for cell in self._neighbours(cx, cy):
+                    if self.grid.get_value(*cell) != color:
+                        continue
+                    other = owner.get(cell)
+                    if other is None:
+                        owner[cell] = index
+                        frontier.append(cell)
+                        members[index].append(cell)
+                        continue
+                    other = find(other)
+                    if other != index:
+                        if len(members[other]) > len(members[index]):
+                            index, other = other, index
+                        group[other] = index
+                        frontiers[index].extend(frontiers.pop(other))
+                        members[index].extend(members.pop(other))
+                        frontier = frontiers[index]
+                if len(frontiers) == 1:
+                    break
+        return pieces
 
 
 class GridInputHandler:
@@ -134,6 +944,8 @@ class GridInputHandler:
                 
                 if len(row) != cols:
                     raise ValueError(f"A linha deve ter exatamente {cols} elementos")
+                if any(value not in (0, 1) for value in row):
+                    raise ValueError("Os valores devem ser 0 (navegável) ou 1 (obstáculo)")
                 
                 data.append(row)
             except ValueError as e:
@@ -171,6 +983,16 @@ class RandomGridGenerator:
                     row.append(0)
             data.append(row)
         return Grid(rows, cols, data)
+    
+    @staticmethod
+    def generate_file(path: str, rows: int, cols: int, obstacle_probability: float = 0.3,
+                      typecode: str = "I") -> GridFile:
+        print(f"Gerando arquivo {path} ({rows}x{cols}) com {obstacle_probability*100:.0f}% de obstáculos...")
+        grid_file = GridFile.create(path, rows, cols, typecode)
+        for i in range(rows):
+            with grid_file.grid.row_view(i) as row:
+                row[:] = array(typecode, [1 if random.random() < obstacle_probability else 0 for _ in range(cols)])
+        return grid_file
 
 
 class AnimatedFloodFill(FloodFillStrategy):
@@ -204,6 +1026,63 @@ class AnimatedFloodFill(FloodFillStrategy):
                 stack.append((x + dx, y + dy))
 
 
+class CellRenderer(ABC):
+    def __init__(self, canvas, grid: Grid, cell_size: int, colors: dict):
+        self.canvas = canvas
+        self.grid = grid
+        self.cell_size = cell_size
+        self.colors = colors
+    
+    def color_of(self, value: int) -> str:
+        return self.colors.get(value, "gray")
+    
+    @abstractmethod
+    def draw_all(self):
+        pass
+    
+    @abstractmethod
+    def draw_cell(self, row: int, col: int, value: int):
+        pass
+
+
+class CanvasItemRenderer(CellRenderer):
+    def draw_all(self):
+        self.items = []
+        size = self.cell_size
+        for i in range(self.grid.rows):
+            for j in range(self.grid.cols):
+                value = self.grid.get_value(i, j)
+                x1 = j * size
+                y1 = i * size
+                rectangle = self.canvas.create_rectangle(x1, y1, x1 + size, y1 + size, fill=self.color_of(value),
+                                                         outline="gray", width=1)
+                text = self.canvas.create_text(x1 + size // 2, y1 + size // 2, text=str(value) if value > 0 else "",
+                                               fill="white" if value == 1 else "black", font=("Arial", 8, "bold"))
+                self.items.append((rectangle, text))
+    
+    def draw_cell(self, row: int, col: int, value: int):
+        rectangle, text = self.items[row * self.grid.cols + col]
+        self.canvas.itemconfig(rectangle, fill=self.color_of(value))
+        self.canvas.itemconfig(text, text=str(value) if value > 0 else "", fill="white" if value == 1 else "black")
+
+
+class PhotoImageRenderer(CellRenderer):
+    def draw_all(self):
+        size = self.cell_size
+        self.image = tk.PhotoImage(width=self.grid.cols * size, height=self.grid.rows * size)
+        self.canvas.create_image(0, 0, image=self.image, anchor=tk.NW)
+        rows = []
+        for i in range(self.grid.rows):
+            pixels = " ".join(" ".join([self.color_of(value)] * size) for value in self.grid.row_view(i).tolist())
+            rows.extend(["{" + pixels + "}"] * size)
+        self.image.put(" ".join(rows))
+    
+    def draw_cell(self, row: int, col: int, value: int):
+        x1 = col * self.cell_size
+        y1 = row * self.cell_size
+        self.image.put(self.color_of(value), to=(x1, y1, x1 + self.cell_size, y1 + self.cell_size))
+
+
 class FloodFillGUI:
     def __init__(self):
         self.root = tk.Tk()
@@ -212,7 +1091,13 @@ class FloodFillGUI:
         
         self.grid = None
         self.canvas = None
+        self.renderer = None
         self.cell_size = 30
+        self.cell_pixels = self.cell_size
+        self.dirty_cells = queue.SimpleQueue()
+        self.generation = 0
+        self.fill_generation = 0
+        self.status_updates = queue.SimpleQueue()
         self.colors = {
             0: "white",
             1: "black", 
@@ -226,11 +1111,12 @@ class FloodFillGUI:
             9: "brown"
         }
         
-        self.strategy = AnimatedFloodFill(self.update_cell, 0.05)
+        self.strategy = AnimatedFloodFill(self.update_cell, DEFAULT_ANIMATION_DELAY)
         self.mapper = TerrainMapper(self.strategy)
         self.is_running = False
         
         self.setup_ui()
+        self.root.after(DEFAULT_FRAME_MS, self.render_frame)
     
     def setup_ui(self):
         control_frame = ttk.Frame(self.root)
@@ -293,6 +1179,10 @@ class FloodFillGUI:
         self.load_sample_grid()
     
     def generate_random_grid(self):
+        if self.is_running:
+            messagebox.showwarning("FloodFill em Andamento", "Aguarde o término do flood fill antes de trocar a grade")
+            return
+        
         try:
             rows = int(self.rows_var.get())
             cols = int(self.cols_var.get())
@@ -310,6 +1200,10 @@ class FloodFillGUI:
             messagebox.showerror("Erro", "Por favor, insira parâmetros válidos")
     
     def load_sample_grid(self):
+        if self.is_running:
+            messagebox.showwarning("FloodFill em Andamento", "Aguarde o término do flood fill antes de trocar a grade")
+            return
+        
         sample_data = [
             [0, 0, 1, 0, 0],
             [0, 1, 1, 0, 0],
@@ -324,46 +1218,71 @@ class FloodFillGUI:
     def draw_grid(self):
         if self.canvas:
             self.canvas.destroy()
+        self.generation += 1
+        self.discard_pending_cells()
+        
+        if self.grid.rows * self.grid.cols > IMAGE_MODE_CELLS:
+            self.cell_pixels = max(1, min(self.cell_size, MAX_CANVAS_WIDTH // self.grid.cols,
+                                          MAX_CANVAS_HEIGHT // self.grid.rows))
+            renderer_class = PhotoImageRenderer
+            self.strategy.delay = 0
+        else:
+            self.cell_pixels = self.cell_size
+            renderer_class = CanvasItemRenderer
+            self.strategy.delay = DEFAULT_ANIMATION_DELAY
         
-        canvas_width = self.grid.cols * self.cell_size
-        canvas_height = self.grid.rows * self.cell_size
+        canvas_width = self.grid.cols * self.cell_pixels
+        canvas_height = self.grid.rows * self.cell_pixels
         
-        self.canvas = tk.Canvas(self.canvas_frame, width=canvas_width, height=canvas_height, bg="gray")
+        self.canvas = tk.Canvas(self.canvas_frame, width=canvas_width, height=canvas_height, bg="gray",
+                                highlightthickness=0)
         self.canvas.pack()
         
         self.canvas.bind("<Button-1>", self.on_cell_click)
         
-        for i in range(self.grid.rows):
-            for j in range(self.grid.cols):
-                self.draw_cell(i, j, self.grid.get_value(i, j))
-    
-    def draw_cell(self, row, col, value):
-        x1 = col * self.cell_size
-        y1 = row * self.cell_size
-        x2 = x1 + self.cell_size
-        y2 = y1 + self.cell_size
-        
-        color = self.colors.get(value, "gray")
-        
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="gray", width=1, 
-                                   tags=f"cell_{row}_{col}")
-        
-        if value > 0:
-            self.canvas.create_text(x1 + self.cell_size//2, y1 + self.cell_size//2, 
-                                  text=str(value), fill="white" if value == 1 else "black",
-                                  font=("Arial", 8, "bold"), tags=f"text_{row}_{col}")
+        self.renderer = renderer_class(self.canvas, self.grid, self.cell_pixels, self.colors)
+        self.renderer.draw_all()
     
     def update_cell(self, row, col, color):
-        if self.canvas:
-            self.root.after(0, lambda: self.draw_cell(row, col, color))
-            self.root.update()
+        self.dirty_cells.put((self.fill_generation, row, col, color))
+    
+    def post_status(self, text):
+        self.status_updates.put(text)
+    
+    def discard_pending_cells(self):
+        while True:
+            try:
+                self.dirty_cells.get_nowait()
+            except queue.Empty:
+                return
+    
+    def render_frame(self):
+        try:
+            for _ in range(DEFAULT_FRAME_BUDGET):
+                try:
+                    generation, row, col, value = self.dirty_cells.get_nowait()
+                except queue.Empty:
+                    break
+                if self.renderer and generation == self.generation:
+                    self.renderer.draw_cell(row, col, value)
+            
+            status = None
+            while True:
+                try:
+                    status = self.status_updates.get_nowait()
+                except queue.Empty:
+                    break
+            if status is not None:
+                self.status_var.set(status)
+        finally:
+            self.root.after(DEFAULT_FRAME_MS, self.render_frame)
     
     def on_cell_click(self, event):
         if self.is_running:
             return
         
-        col = event.x // self.cell_size
-        row = event.y // self.cell_size
+        col = event.x // self.cell_pixels
+        row = event.y // self.cell_pixels
         
         if self.grid and self.grid.is_valid_position(row, col):
             if self.grid.get_value(row, col) != 0:
@@ -377,12 +1296,13 @@ class FloodFillGUI:
     
     def highlight_selected_cell(self, row, col):
         self.canvas.delete("selection")
-        x1 = col * self.cell_size
-        y1 = row * self.cell_size
-        x2 = x1 + self.cell_size
-        y2 = y1 + self.cell_size
+        x1 = col * self.cell_pixels
+        y1 = row * self.cell_pixels
+        x2 = x1 + self.cell_pixels
+        y2 = y1 + self.cell_pixels
         
-        self.canvas.create_rectangle(x1, y1, x2, y2, outline="blue", width=3, tags="selection")
+        self.canvas.create_rectangle(x1, y1, x2, y2, outline="blue", width=3 if self.cell_pixels > 4 else 1,
+                                     tags="selection")
     
     def clear_selection(self):
         if self.canvas:
@@ -397,19 +1317,20 @@ class FloodFillGUI:
             return
         
         self.is_running = True
+        self.fill_generation = self.generation
         row, col = self.selected_cell
         
         def run_fill():
             try:
-                self.status_var.set(f"Preenchendo região a partir de ({row}, {col})...")
+                self.post_status(f"Preenchendo região a partir de ({row}, {col})...")
                 self.mapper.fill_region(self.grid, row, col)
                 
                 time.sleep(0.5)
                 
-                self.status_var.set("Mapeando todas as regiões restantes...")
+                self.post_status("Mapeando todas as regiões restantes...")
                 self.mapper.map_all_regions(self.grid)
                 
-                self.status_var.set("FloodFill concluído!")
+                self.post_status("FloodFill concluído!")
             finally:
                 self.is_running = False
         
@@ -442,7 +1363,7 @@ class FloodFillGUI:
 
 class FloodFillApp:
     def __init__(self):
-        self.strategy = IterativeFloodFill()
+        self.strategy = ScanlineFloodFill()
         self.mapper = TerrainMapper(self.strategy)
     
     def create_sample_grid(self) -> Grid:
@@ -468,7 +1389,7 @@ class FloodFillApp:
         grid.display()
         
         print("Mapeando todas as regiões restantes:")
-        self.mapper.map_all_regions(grid)
+        self.mapper.map_all_regions(grid, TerrainMapper.print_region)
         
         print("Grade final:")
         grid.display()
@@ -491,7 +1412,7 @@ class FloodFillApp:
         grid.display()
         
         print("Mapeando todas as regiões restantes:")
-        self.mapper.map_all_regions(grid)
+        self.mapper.map_all_regions(grid, TerrainMapper.print_region)
         
         print("Grade final:")
         grid.display()
@@ -528,11 +1449,41 @@ class FloodFillApp:
         print("5+ - Cores adicionais\n")
         
         print("Iniciando flood fill automático...")
-        mapper.map_all_regions(grid)
+        mapper.map_all_regions(grid, TerrainMapper.print_region)
         
         print("Grade final com todas as regiões preenchidas:")
         grid.display()
     
+    def run_file(self):
+        print("Mapeamento de Arquivo de Grade (memória mapeada)")
+        print("=" * 50)
+        
+        path = input("Digite o caminho do arquivo de grade (padrão terreno.grid): ").strip() or "terreno.grid"
+        if os.path.exists(path):
+            grid_file = GridFile(path)
+        else:
+            try:
+                rows = int(input("Arquivo não encontrado. Linhas da nova grade (padrão 1000): ") or "1000")
+                cols = int(input("Colunas da nova grade (padrão 1000): ") or "1000")
+                if rows <= 0 or cols <= 0:
+                    raise ValueError("Parâmetros inválidos")
+            except ValueError:
+                print("Usando valores padrão: grade 1000x1000")
+                rows, cols = 1000, 1000
+            grid_file = RandomGridGenerator.generate_file(path, rows, cols)
+        
+        with grid_file:
+            grid = grid_file.grid
+            print(f"Rotulando grade {grid.rows}x{grid.cols} em faixas de {DEFAULT_BAND_ROWS} linhas...")
+            start = time.perf_counter()
+            mapper = TerrainMapper(self.strategy, StreamingLabeler())
+            count = mapper.map_all_regions(grid)
+            grid_file.flush()
+            print(f"{count} regiões rotuladas em {time.perf_counter() - start:.2f}s")
+            
+            for region in sorted(mapper.regions, key=lambda region: region.size, reverse=True)[:5]:
+                print(f"Cor {region.color}: {region.size} células, semente {region.seed}, limites {region.bounds}")
+    
     def run_gui(self):
         if not GUI_AVAILABLE:
             print("Erro: Interface gráfica não disponível. Módulo tkinter não encontrado.")
@@ -553,8 +1504,9 @@ class FloodFillApp:
             print("4. Interface gráfica")
         else:
             print("4. Interface gráfica (indisponível - tkinter não instalado)")
+        print("5. Mapear arquivo de grade")
         
-        choice = input("Escolha uma opção (1, 2, 3, ou 4): ").strip()
+        choice = input("Escolha uma opção (1, 2, 3, 4 ou 5): ").strip()
         
         if choice == "1":
             self.run_sample()
@@ -568,6 +1520,8 @@ class FloodFillApp:
             else:
                 print("Interface gráfica não disponível. Executando demonstração de exemplo.")
                 self.run_sample()
+        elif choice == "5":
+            self.run_file()
         else:
             print("Opção inválida. Executando demonstração de exemplo.")
             self.run_sample()
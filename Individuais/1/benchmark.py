@@ -0,0 +1,245 @@
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from itertools import repeat
+from typing import Callable, Dict, List, Optional, Tuple
+
+from main import (BINARY, DECIMAL, DEFAULT_CUTOFF_BITS, KARATSUBA, STRATEGIES, KaratsubaProfiler,
+                  create_multiplier)
+
+NATIVE = "native"
+BALANCED = "balanced"
+UNBALANCED_SHAPE = "unbalanced"
+SQUARE = "square"
+SHAPES = (BALANCED, UNBALANCED_SHAPE, SQUARE)
+
+DEFAULT_SIZES = (10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6)
+DEFAULT_REPEATS = 7
+DEFAULT_BUDGET_SECONDS = 10.0
+DEFAULT_MIN_SAMPLE_SECONDS = 0.02
+DEFAULT_UNBALANCED_RATIO = 1000
+BITS_PER_DIGIT = 3.321928094887362
+ENGINE_CHECK_DIGITS = (4301, 10000)
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class BenchmarkCase:
+    def __init__(self, digits: int, shape: str, x: int, y: int):
+        self.digits = digits
+        self.shape = shape
+        self.x = x
+        self.y = y
+
+
+class OperandGenerator:
+    def __init__(self, seed: int = 0, unbalanced_ratio: int = DEFAULT_UNBALANCED_RATIO):
+        self.rng = random.Random(seed)
+        self.unbalanced_ratio = unbalanced_ratio
+
+    def random_operand(self, digits: int) -> int:
+        bits = max(1, int(digits * BITS_PER_DIGIT))
+        return self.rng.getrandbits(bits) | (1 << (bits - 1))
+
+    def case(self, digits: int, shape: str) -> BenchmarkCase:
+        x = self.random_operand(digits)
+        if shape == SQUARE:
+            y = x
+        elif shape == UNBALANCED_SHAPE:
+            y = self.random_operand(max(1, digits // self.unbalanced_ratio))
+        else:
+            y = self.random_operand(digits)
+        return BenchmarkCase(digits, shape, x, y)
+
+
+class BenchmarkRunner:
+    def __init__(self, repeats: int = DEFAULT_REPEATS, budget_seconds: float = DEFAULT_BUDGET_SECONDS,
+                 min_sample_seconds: float = DEFAULT_MIN_SAMPLE_SECONDS):
+        self.repeats = repeats
+        self.budget_seconds = budget_seconds
+        self.min_sample_seconds = min_sample_seconds
+
+    def time_function(self, function: Callable[[int, int], int], case: BenchmarkCase,
+                      expected: Optional[int] = None) -> List[float]:
+        product = function(case.x, case.y)
+        if expected is not None and product != expected:
+            raise AssertionError(f"Wrong product for {case.shape} {case.digits}-digit operands")
+
+        number, elapsed = self.autorange(function, case)
+        samples = [elapsed / number]
+        spent = elapsed
+        while len(samples) < self.repeats and spent <= self.budget_seconds:
+            elapsed = self._time_loop(function, case, number)
+            samples.append(elapsed / number)
+            spent += elapsed
+        return samples
+
+    def autorange(self, function: Callable[[int, int], int], case: BenchmarkCase) -> Tuple[int, float]:
+        number = 1
+        while True:
+            for multiplier in (1, 2, 5):
+                loops = number * multiplier
+                elapsed = self._time_loop(function, case, loops)
+                if elapsed >= self.min_sample_seconds:
+                    return loops, elapsed
+            number *= 10
+
+    @staticmethod
+    def _time_loop(function: Callable[[int, int], int], case: BenchmarkCase, number: int) -> float:
+        x, y = case.x, case.y
+        start = time.perf_counter()
+        for _ in repeat(None, number):
+            function(x, y)
+        return time.perf_counter() - start
+
+    def summarize(self, samples: List[float]) -> Dict[str, float]:
+        return {
+            "runs": len(samples),
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "p90": percentile(samples, 0.90),
+            "p99": percentile(samples, 0.99),
+        }
+
+
+class KaratsubaBenchmark:
+    def __init__(self, sizes: Tuple[int, ...] = DEFAULT_SIZES, shapes: Tuple[str, ...] = SHAPES,
+                 strategies: Tuple[str, ...] = STRATEGIES, base: str = BINARY,
+                 cutoff_bits: int = DEFAULT_CUTOFF_BITS, runner: Optional[BenchmarkRunner] = None,
+                 seed: int = 0):
+        self.sizes = sizes
+        self.shapes = shapes
+        self.strategies = strategies
+        self.base = base
+        self.cutoff_bits = cutoff_bits
+        self.runner = runner or BenchmarkRunner()
+        self.seed = seed
+
+    def run(self, progress: Optional[Callable[[Dict[str, object]], None]] = None) -> Dict[str, object]:
+        generator = OperandGenerator(self.seed)
+        results = []
+        over_budget = set()
+        for digits in self.sizes:
+            for shape in self.shapes:
+                case = generator.case(digits, shape)
+                native_samples = self.runner.time_function(lambda a, b: a * b, case)
+                native = self.runner.summarize(native_samples)
+                expected = case.x * case.y
+                rows = [self._row(case, NATIVE, native, native["median"])]
+                for strategy in self.strategies:
+                    if (strategy, shape) in over_budget:
+                        rows.append(self._skipped_row(case, strategy))
+                        continue
+                    multiplier = create_multiplier(strategy, self.base, self.cutoff_bits)
+                    samples = self.runner.time_function(multiplier.multiply, case, expected)
+                    if sum(samples) > self.runner.budget_seconds:
+                        over_budget.add((strategy, shape))
+                    rows.append(self._row(case, strategy, self.runner.summarize(samples), native["median"]))
+                for row in rows:
+                    results.append(row)
+                    if progress is not None:
+                        progress(row)
+        return {"environment": self.environment(), "results": results}
+
+    def environment(self) -> Dict[str, object]:
+        return {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "base": self.base,
+            "cutoff_bits": self.cutoff_bits,
+            "repeats": self.runner.repeats,
+            "min_sample_seconds": self.runner.min_sample_seconds,
+            "seed": self.seed,
+        }
+
+    def _row(self, case: BenchmarkCase, strategy: str, summary: Dict[str, float],
+             native_median: float) -> Dict[str, object]:
+        row = {"digits": case.digits, "shape": case.shape, "strategy": strategy, "skipped": False}
+        row.update(summary)
+        row["ratio_to_native"] = summary["median"] / native_median if native_median else None
+        return row
+
+    def _skipped_row(self, case: BenchmarkCase, strategy: str) -> Dict[str, object]:
+        return {"digits": case.digits, "shape": case.shape, "strategy": strategy, "skipped": True}
+
+
+def check_engines(digits: Tuple[int, ...] = ENGINE_CHECK_DIGITS, cutoff_bits: int = DEFAULT_CUTOFF_BITS,
+                  seed: int = 0) -> List[str]:
+    generator = OperandGenerator(seed)
+    failures = []
+    for size in digits:
+        for shape in SHAPES:
+            case = generator.case(size, shape)
+            expected = case.x * case.y
+            engines = {
+                BINARY: create_multiplier(KARATSUBA, BINARY, cutoff_bits),
+                DECIMAL: create_multiplier(KARATSUBA, DECIMAL, cutoff_bits),
+                "decimal-profiled": create_multiplier(KARATSUBA, DECIMAL, cutoff_bits, profiler=KaratsubaProfiler()),
+            }
+            for name, multiplier in engines.items():
+                if multiplier.multiply(case.x, case.y) != expected:
+                    failures.append(f"{name} engine disagrees on {shape} {size}-digit operands")
+    return failures
+
+
+class BenchmarkReporter:
+    @staticmethod
+    def header() -> str:
+        return f"{'digits':>9} {'shape':<11} {'strategy':<11} {'median(s)':>11} {'p90(s)':>11} {'p99(s)':>11} {'x native':>9}"
+
+    @staticmethod
+    def format_row(row: Dict[str, object]) -> str:
+        prefix = f"{row['digits']:>9} {row['shape']:<11} {row['strategy']:<11}"
+        if row["skipped"]:
+            return f"{prefix} {'skipped (over budget at a smaller size)':>45}"
+        ratio = row["ratio_to_native"]
+        ratio_text = f"{ratio:>9.2f}" if ratio is not None else f"{'-':>9}"
+        return f"{prefix} {row['median']:>11.3e} {row['p90']:>11.3e} {row['p99']:>11.3e} {ratio_text}"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark Karatsuba strategies against native multiplication")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="operand sizes in decimal digits")
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=list(SHAPES))
+    parser.add_argument("--strategies", nargs="+", choices=STRATEGIES, default=list(STRATEGIES))
+    parser.add_argument("--base", choices=(BINARY, DECIMAL), default=BINARY)
+    parser.add_argument("--cutoff", type=int, default=DEFAULT_CUTOFF_BITS)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS,
+                        help="seconds per case; strategies over budget are skipped at larger sizes")
+    parser.add_argument("--min-sample", type=float, default=DEFAULT_MIN_SAMPLE_SECONDS,
+                        help="seconds per sample; fast calls are looped and averaged until this is reached")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="FILE", help="write machine-readable results to FILE")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    failures = check_engines(cutoff_bits=args.cutoff, seed=args.seed)
+    for failure in failures:
+        print(failure)
+    if failures:
+        sys.exit(1)
+    print(f"Binary and decimal engines agree on {', '.join(map(str, ENGINE_CHECK_DIGITS))}-digit operands")
+    runner = BenchmarkRunner(args.repeats, args.budget, args.min_sample)
+    benchmark = KaratsubaBenchmark(tuple(args.sizes), tuple(args.shapes), tuple(args.strategies),
+                                   args.base, args.cutoff, runner, args.seed)
+    print(BenchmarkReporter.header())
+    report = benchmark.run(lambda row: print(BenchmarkReporter.format_row(row), flush=True))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results saved to {args.json}")
@@ -1,37 +1,889 @@
-class KaratsubaMultiplier:
+import argparse
+import decimal
+import json
+import os
+import random
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice, repeat
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+BINARY = "binary"
+DECIMAL = "decimal"
+
+KARATSUBA = "karatsuba"
+TOOM3 = "toom3"
+UNBALANCED = "unbalanced"
+SCHOOLBOOK = "schoolbook"
+AUTO = "auto"
+STRATEGIES = (KARATSUBA, TOOM3, UNBALANCED, SCHOOLBOOK, AUTO)
+
+DEFAULT_CUTOFF_BITS = 2048
+DEFAULT_LIMB_BITS = 64
+DEFAULT_TOOM3_BITS = 1 << 15
+DEFAULT_UNBALANCED_RATIO = 2
+DEFAULT_PARALLEL_BITS = 1 << 20
+DEFAULT_BATCH_CHUNK = 256
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+DEFAULT_CACHE_MIN_BITS = 4096
+DECIMAL_CHUNK_DIGITS = 2048
+DECIMAL_CHUNK_BITS = 6400
+
+HEX = "hex"
+RAW = "binary"
+OPERAND_FORMATS = (DECIMAL, HEX, RAW)
+CUTOFF_CANDIDATES = (0, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+CUTOFF_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "karatsuba_cutoffs.json")
+LOG10_2 = 0.30102999566398120
+
+
+def size_class(x: int, y: int) -> int:
+    return max(abs(x).bit_length(), abs(y).bit_length()).bit_length()
+
+
+@lru_cache(maxsize=128)
+def power_of_ten(exponent: int) -> int:
+    return 10 ** exponent
+
+
+def decimal_digits(value: int) -> int:
+    value = abs(value)
+    if value < 10:
+        return 1
+    digits = int(value.bit_length() * LOG10_2) + 1
+    if value < power_of_ten(digits - 1):
+        return digits - 1
+    if value >= power_of_ten(digits):
+        return digits + 1
+    return digits
+
+
+class MultiplicationStrategy(ABC):
+    @abstractmethod
+    def multiply(self, x: int, y: int) -> int:
+        pass
+
+
+class SchoolbookMultiplier(MultiplicationStrategy):
+    def __init__(self, limb_bits: int = DEFAULT_LIMB_BITS):
+        if limb_bits <= 0:
+            raise ValueError("Limb size must be positive")
+        self.limb_bits = limb_bits
+
+    def multiply(self, x: int, y: int) -> int:
+        negative = (x < 0) != (y < 0)
+        x, y = abs(x), abs(y)
+        if x.bit_length() < y.bit_length():
+            x, y = y, x
+        mask = (1 << self.limb_bits) - 1
+        result = 0
+        shift = 0
+        while y:
+            limb = y & mask
+            if limb:
+                result += (x * limb) << shift
+            y >>= self.limb_bits
+            shift += self.limb_bits
+        return -result if negative else result
+
+
+class SubproductCache:
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES, min_bits: int = DEFAULT_CACHE_MIN_BITS):
+        if max_bytes <= 0:
+            raise ValueError("Memory budget must be positive")
+        self.max_bytes = max_bytes
+        self.min_bits = min_bits
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[int, int], int]" = OrderedDict()
+
+    def get(self, x: int, y: int) -> Optional[int]:
+        key = (x, y) if x <= y else (y, x)
+        product = self._entries.get(key)
+        if product is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return product
+
+    def put(self, x: int, y: int, product: int) -> None:
+        key = (x, y) if x <= y else (y, x)
+        if key in self._entries:
+            return
+        entry_bytes = sys.getsizeof(x) + sys.getsizeof(y) + sys.getsizeof(product)
+        if entry_bytes > self.max_bytes:
+            return
+        self._entries[key] = product
+        self.size_bytes += entry_bytes
+        while self.size_bytes > self.max_bytes:
+            (old_x, old_y), old_product = self._entries.popitem(last=False)
+            self.size_bytes -= sys.getsizeof(old_x) + sys.getsizeof(old_y) + sys.getsizeof(old_product)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "bytes": self.size_bytes,
+                "hits": self.hits, "misses": self.misses}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_entries"] = OrderedDict()
+        state["size_bytes"] = 0
+        return state
+
+
+class LevelStats:
+    def __init__(self, depth: int):
+        self.depth = depth
+        self.calls = 0
+        self.native_calls = 0
+        self.cache_hits = 0
+        self.min_bits = 0
+        self.max_bits = 0
+        self.total_bits = 0
+        self.seconds = 0.0
+        self.split_seconds = 0.0
+        self.native_seconds = 0.0
+        self.combine_seconds = 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "depth": self.depth,
+            "calls": self.calls,
+            "native_calls": self.native_calls,
+            "cache_hits": self.cache_hits,
+            "min_bits": self.min_bits,
+            "max_bits": self.max_bits,
+            "mean_bits": self.total_bits / self.calls if self.calls else 0,
+            "seconds": self.seconds,
+            "split_seconds": self.split_seconds,
+            "native_seconds": self.native_seconds,
+            "combine_seconds": self.combine_seconds,
+        }
+
+
+class KaratsubaProfiler:
+    def __init__(self):
+        self.levels: Dict[int, LevelStats] = {}
+        self.total_seconds = 0.0
+        self.baseline_seconds = 0.0
+
+    def record(self, depth: int, x: int, y: int, seconds: float, split_seconds: float = 0.0,
+               native_seconds: float = 0.0, combine_seconds: float = 0.0, native: bool = False,
+               cache_hit: bool = False) -> None:
+        level = self.levels.get(depth)
+        if level is None:
+            level = self.levels[depth] = LevelStats(depth)
+        bits = max(x.bit_length(), y.bit_length())
+        if level.calls == 0 or bits < level.min_bits:
+            level.min_bits = bits
+        level.max_bits = max(level.max_bits, bits)
+        level.calls += 1
+        level.total_bits += bits
+        level.seconds += seconds
+        level.split_seconds += split_seconds
+        level.native_seconds += native_seconds
+        level.combine_seconds += combine_seconds
+        if native:
+            level.native_calls += 1
+        if cache_hit:
+            level.cache_hits += 1
+        if depth == 0:
+            self.total_seconds += seconds
+
+    def measure_baseline(self, x: int, y: int) -> None:
+        start = time.perf_counter()
+        x * y
+        self.baseline_seconds += time.perf_counter() - start
+
+    def reset(self) -> None:
+        self.levels.clear()
+        self.total_seconds = 0.0
+        self.baseline_seconds = 0.0
+
+    def report(self) -> Dict[str, object]:
+        levels = [self.levels[depth].to_dict() for depth in sorted(self.levels)]
+        return {
+            "total_seconds": self.total_seconds,
+            "split_seconds": sum(level["split_seconds"] for level in levels),
+            "native_seconds": sum(level["native_seconds"] for level in levels),
+            "combine_seconds": sum(level["combine_seconds"] for level in levels),
+            "baseline_seconds": self.baseline_seconds,
+            "slowdown": self.total_seconds / self.baseline_seconds if self.baseline_seconds else None,
+            "levels": levels,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.report(), indent=2)
+
+
+class KaratsubaMultiplier(MultiplicationStrategy):
+    def __init__(self, base: str = BINARY, cutoff_bits: int = DEFAULT_CUTOFF_BITS,
+                 cutoffs: Optional[Dict[int, int]] = None, cache: Optional[SubproductCache] = None,
+                 profiler: Optional[KaratsubaProfiler] = None):
+        if base not in (BINARY, DECIMAL):
+            raise ValueError(f"Unknown base: {base}")
+        if cutoff_bits < 0:
+            raise ValueError("Cutoff must be non-negative")
+        self.base = base
+        self.cutoff_bits = cutoff_bits
+        self.cutoffs = dict(cutoffs or {})
+        self.cache = cache
+        self.profiler = profiler
+
+    def cutoff_for(self, x: int, y: int) -> int:
+        operand_class = size_class(x, y)
+        known = [c for c in self.cutoffs if c <= operand_class]
+        if not known:
+            return self.cutoff_bits
+        return self.cutoffs[max(known)]
+
     def multiply(self, x: int, y: int) -> int:
-        if x < 10 or y < 10:
+        cutoff = self.cutoff_for(x, y)
+        if self.profiler is not None:
+            self.profiler.measure_baseline(x, y)
+            if self.base == DECIMAL:
+                return self._multiply_profiled(x, y, cutoff, 0)
+            if (x < 0) != (y < 0):
+                return -self._multiply_profiled(abs(x), abs(y), cutoff, 0)
+            return self._multiply_profiled(abs(x), abs(y), cutoff, 0)
+        if self.base == DECIMAL:
+            return self._multiply_decimal(x, y, cutoff)
+        if (x < 0) != (y < 0):
+            return -self._multiply_binary(abs(x), abs(y), cutoff)
+        return self._multiply_binary(abs(x), abs(y), cutoff)
+
+    def _multiply_profiled(self, x: int, y: int, cutoff: int, depth: int) -> int:
+        start = time.perf_counter()
+        if x < 10 or y < 10 or x.bit_length() <= cutoff or y.bit_length() <= cutoff:
+            product = x * y
+            elapsed = time.perf_counter() - start
+            self.profiler.record(depth, x, y, elapsed, native_seconds=elapsed, native=True)
+            return product
+        cached = self._cache_get(x, y)
+        if cached is not None:
+            self.profiler.record(depth, x, y, time.perf_counter() - start, cache_hit=True)
+            return cached
+
+        split_start = time.perf_counter()
+        if self.base == DECIMAL:
+            m = max(decimal_digits(x), decimal_digits(y)) // 2
+            high_x, low_x = divmod(x, power_of_ten(m))
+            high_y, low_y = (high_x, low_x) if x == y else divmod(y, power_of_ten(m))
+        else:
+            m = max(x.bit_length(), y.bit_length()) // 2
+            mask = (1 << m) - 1
+            high_x, low_x = x >> m, x & mask
+            high_y, low_y = (high_x, low_x) if x == y else (y >> m, y & mask)
+        split_seconds = time.perf_counter() - split_start
+
+        z0 = self._multiply_profiled(low_x, low_y, cutoff, depth + 1)
+        z1 = self._multiply_profiled(low_x + high_x, low_y + high_y, cutoff, depth + 1)
+        z2 = self._multiply_profiled(high_x, high_y, cutoff, depth + 1)
+
+        combine_start = time.perf_counter()
+        if self.base == DECIMAL:
+            product = (z2 * power_of_ten(2 * m)) + ((z1 - z2 - z0) * power_of_ten(m)) + z0
+        else:
+            product = (z2 << (2 * m)) + ((z1 - z2 - z0) << m) + z0
+        end = time.perf_counter()
+        self.profiler.record(depth, x, y, end - start, split_seconds=split_seconds,
+                             combine_seconds=end - combine_start)
+        return self._cache_put(x, y, product)
+
+    def _cache_get(self, x: int, y: int) -> Optional[int]:
+        if self.cache is None or min(x.bit_length(), y.bit_length()) < self.cache.min_bits:
+            return None
+        return self.cache.get(x, y)
+
+    def _cache_put(self, x: int, y: int, product: int) -> int:
+        if self.cache is not None and min(x.bit_length(), y.bit_length()) >= self.cache.min_bits:
+            self.cache.put(x, y, product)
+        return product
+
+    def _multiply_decimal(self, x: int, y: int, cutoff: int) -> int:
+        if x < 10 or y < 10 or x.bit_length() <= cutoff or y.bit_length() <= cutoff:
             return x * y
-        n = max(len(str(x)), len(str(y)))
+        if x == y:
+            return self._square_decimal(x, cutoff)
+        cached = self._cache_get(x, y)
+        if cached is not None:
+            return cached
+        n = max(decimal_digits(x), decimal_digits(y))
         m = n // 2
-        high_x, low_x = divmod(x, 10 ** m)
-        high_y, low_y = divmod(y, 10 ** m)
-        z0 = self.multiply(low_x, low_y)
-        z1 = self.multiply(low_x + high_x, low_y + high_y)
-        z2 = self.multiply(high_x, high_y)
-        return (z2 * 10 ** (2 * m)) + ((z1 - z2 - z0) * 10 ** m) + z0
+        high_x, low_x = divmod(x, power_of_ten(m))
+        high_y, low_y = divmod(y, power_of_ten(m))
+        z0 = self._multiply_decimal(low_x, low_y, cutoff)
+        z1 = self._multiply_decimal(low_x + high_x, low_y + high_y, cutoff)
+        z2 = self._multiply_decimal(high_x, high_y, cutoff)
+        return self._cache_put(x, y, (z2 * power_of_ten(2 * m)) + ((z1 - z2 - z0) * power_of_ten(m)) + z0)
+
+    def _square_decimal(self, x: int, cutoff: int) -> int:
+        if x < 10 or x.bit_length() <= cutoff:
+            return x * x
+        cached = self._cache_get(x, x)
+        if cached is not None:
+            return cached
+        m = decimal_digits(x) // 2
+        high, low = divmod(x, power_of_ten(m))
+        z0 = self._square_decimal(low, cutoff)
+        z1 = self._square_decimal(low + high, cutoff)
+        z2 = self._square_decimal(high, cutoff)
+        return self._cache_put(x, x, (z2 * power_of_ten(2 * m)) + ((z1 - z2 - z0) * power_of_ten(m)) + z0)
+
+    def _multiply_binary(self, x: int, y: int, cutoff: int) -> int:
+        if x < 10 or y < 10 or x.bit_length() <= cutoff or y.bit_length() <= cutoff:
+            return x * y
+        if x == y:
+            return self._square_binary(x, cutoff)
+        cached = self._cache_get(x, y)
+        if cached is not None:
+            return cached
+        m = max(x.bit_length(), y.bit_length()) // 2
+        mask = (1 << m) - 1
+        high_x, low_x = x >> m, x & mask
+        high_y, low_y = y >> m, y & mask
+        z0 = self._multiply_binary(low_x, low_y, cutoff)
+        z1 = self._multiply_binary(low_x + high_x, low_y + high_y, cutoff)
+        z2 = self._multiply_binary(high_x, high_y, cutoff)
+        return self._cache_put(x, y, (z2 << (2 * m)) + ((z1 - z2 - z0) << m) + z0)
+
+    def _square_binary(self, x: int, cutoff: int) -> int:
+        if x < 10 or x.bit_length() <= cutoff:
+            return x * x
+        cached = self._cache_get(x, x)
+        if cached is not None:
+            return cached
+        m = x.bit_length() // 2
+        high, low = x >> m, x & ((1 << m) - 1)
+        z0 = self._square_binary(low, cutoff)
+        z1 = self._square_binary(low + high, cutoff)
+        z2 = self._square_binary(high, cutoff)
+        return self._cache_put(x, x, (z2 << (2 * m)) + ((z1 - z2 - z0) << m) + z0)
+
+
+class UnbalancedKaratsubaMultiplier(MultiplicationStrategy):
+    def __init__(self, inner: Optional[MultiplicationStrategy] = None,
+                 ratio: int = DEFAULT_UNBALANCED_RATIO, min_slice_bits: int = DEFAULT_CUTOFF_BITS):
+        if ratio < 2:
+            raise ValueError("Ratio must be at least 2")
+        self.inner = inner or KaratsubaMultiplier()
+        self.ratio = ratio
+        self.min_slice_bits = min_slice_bits
+
+    def multiply(self, x: int, y: int) -> int:
+        negative = (x < 0) != (y < 0)
+        x, y = abs(x), abs(y)
+        if x.bit_length() < y.bit_length():
+            x, y = y, x
+        result = self._multiply_sliced(x, y, max(y.bit_length(), self.min_slice_bits))
+        return -result if negative else result
+
+    def _multiply_sliced(self, long: int, short: int, short_bits: int) -> int:
+        long_bits = long.bit_length()
+        if long_bits < self.ratio * short_bits:
+            return self.inner.multiply(long, short)
+        half = long_bits // 2
+        high, low = long >> half, long & ((1 << half) - 1)
+        return (self._multiply_sliced(high, short, short_bits) << half) + \
+            self._multiply_sliced(low, short, short_bits)
+
+
+class ToomCook3Multiplier(MultiplicationStrategy):
+    def __init__(self, cutoff_bits: int = DEFAULT_CUTOFF_BITS):
+        if cutoff_bits < 0:
+            raise ValueError("Cutoff must be non-negative")
+        self.cutoff_bits = cutoff_bits
+
+    def multiply(self, x: int, y: int) -> int:
+        negative = (x < 0) != (y < 0)
+        result = self._multiply_toom3(abs(x), abs(y))
+        return -result if negative else result
+
+    def _multiply_signed(self, x: int, y: int) -> int:
+        if (x < 0) != (y < 0):
+            return -self._multiply_toom3(abs(x), abs(y))
+        return self._multiply_toom3(abs(x), abs(y))
+
+    def _multiply_toom3(self, x: int, y: int) -> int:
+        if x < 10 or y < 10 or x.bit_length() <= self.cutoff_bits or y.bit_length() <= self.cutoff_bits:
+            return x * y
+        k = (max(x.bit_length(), y.bit_length()) + 2) // 3
+        mask = (1 << k) - 1
+        x0, x1, x2 = x & mask, (x >> k) & mask, x >> (2 * k)
+        y0, y1, y2 = y & mask, (y >> k) & mask, y >> (2 * k)
+
+        x02, y02 = x0 + x2, y0 + y2
+        r0 = self._multiply_toom3(x0, y0)
+        r1 = self._multiply_toom3(x02 + x1, y02 + y1)
+        rm1 = self._multiply_signed(x02 - x1, y02 - y1)
+        rm2 = self._multiply_signed(x0 - 2 * x1 + 4 * x2, y0 - 2 * y1 + 4 * y2)
+        rinf = self._multiply_toom3(x2, y2)
+
+        c3 = (rm2 - r1) // 3
+        c1 = (r1 - rm1) >> 1
+        c2 = rm1 - r0
+        c3 = ((c2 - c3) >> 1) + 2 * rinf
+        c2 = c2 + c1 - rinf
+        c1 = c1 - c3
+        return (rinf << (4 * k)) + (c3 << (3 * k)) + (c2 << (2 * k)) + (c1 << k) + r0
+
+
+class MultiplierDispatcher(MultiplicationStrategy):
+    def __init__(self, karatsuba: Optional[KaratsubaMultiplier] = None,
+                 native_bits: int = DEFAULT_CUTOFF_BITS, toom3_bits: int = DEFAULT_TOOM3_BITS,
+                 unbalanced_ratio: int = DEFAULT_UNBALANCED_RATIO):
+        self.karatsuba = karatsuba or KaratsubaMultiplier()
+        self.toom3 = ToomCook3Multiplier(self.karatsuba.cutoff_bits)
+        self.unbalanced = UnbalancedKaratsubaMultiplier(self.karatsuba, unbalanced_ratio)
+        self.native_bits = native_bits
+        self.toom3_bits = toom3_bits
+        self.unbalanced_ratio = unbalanced_ratio
+
+    def select(self, x: int, y: int) -> MultiplicationStrategy:
+        short_bits, long_bits = sorted((abs(x).bit_length(), abs(y).bit_length()))
+        if short_bits <= self.native_bits:
+            return self.karatsuba
+        if long_bits >= self.unbalanced_ratio * short_bits:
+            return self.unbalanced
+        if short_bits >= self.toom3_bits:
+            return self.toom3
+        return self.karatsuba
+
+    def multiply(self, x: int, y: int) -> int:
+        return self.select(x, y).multiply(x, y)
+
+
+def _multiply_task(multiplier: MultiplicationStrategy, x: int, y: int) -> int:
+    return multiplier.multiply(x, y)
+
+
+class ParallelKaratsubaMultiplier(MultiplicationStrategy):
+    def __init__(self, inner: Optional[MultiplicationStrategy] = None, workers: Optional[int] = None,
+                 levels: int = 1, parallel_bits: int = DEFAULT_PARALLEL_BITS):
+        if levels not in (1, 2):
+            raise ValueError("Levels must be 1 (3 tasks) or 2 (9 tasks)")
+        self.inner = inner or KaratsubaMultiplier()
+        self.workers = workers
+        self.levels = levels
+        self.parallel_bits = parallel_bits
+        self._pool = None
+
+    def multiply(self, x: int, y: int) -> int:
+        if min(abs(x).bit_length(), abs(y).bit_length()) < self.parallel_bits:
+            return self.inner.multiply(x, y)
+        negative = (x < 0) != (y < 0)
+        leaves: List[Tuple[int, int]] = []
+        plan = self._plan(abs(x), abs(y), self.levels, leaves)
+        products = self._get_pool().map(_multiply_task, repeat(self.inner), *zip(*leaves))
+        result = self._combine(plan, iter(products))
+        return -result if negative else result
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers)
+        return self._pool
+
+    def _plan(self, x: int, y: int, levels: int, leaves: List[Tuple[int, int]]):
+        if levels == 0 or x < 10 or y < 10:
+            leaves.append((x, y))
+            return None
+        m = max(x.bit_length(), y.bit_length()) // 2
+        mask = (1 << m) - 1
+        high_x, low_x = x >> m, x & mask
+        high_y, low_y = y >> m, y & mask
+        children = (
+            self._plan(low_x, low_y, levels - 1, leaves),
+            self._plan(low_x + high_x, low_y + high_y, levels - 1, leaves),
+            self._plan(high_x, high_y, levels - 1, leaves),
+        )
+        return m, children
+
+    def _combine(self, plan, products) -> int:
+        if plan is None:
+            return next(products)
+        m, children = plan
+        z0, z1, z2 = (self._combine(child, products) for child in children)
+        return (z2 << (2 * m)) + ((z1 - z2 - z0) << m) + z0
+
+
+def _multiply_chunk(multiplier: MultiplicationStrategy, pairs: List[Tuple[int, int]]) -> List[int]:
+    return [multiplier.multiply(x, y) for x, y in pairs]
+
+
+class BatchMultiplier:
+    def __init__(self, multiplier: MultiplicationStrategy, workers: Optional[int] = None,
+                 chunk_size: int = DEFAULT_BATCH_CHUNK):
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        self.multiplier = multiplier
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+    def multiply_all(self, pairs: Iterable[Tuple[int, int]]) -> Iterator[int]:
+        if self.workers is None:
+            for x, y in pairs:
+                yield self.multiplier.multiply(x, y)
+            return
+        pairs = iter(pairs)
+        max_pending = 2 * self.workers
+        with ProcessPoolExecutor(self.workers) as pool:
+            pending = deque()
+            while True:
+                while len(pending) < max_pending:
+                    chunk = list(islice(pairs, self.chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(pool.submit(_multiply_chunk, self.multiplier, chunk))
+                if not pending:
+                    return
+                yield from pending.popleft().result()
+
+
+def create_multiplier(strategy: str = KARATSUBA, base: str = BINARY,
+                      cutoff_bits: int = DEFAULT_CUTOFF_BITS,
+                      cutoffs: Optional[Dict[int, int]] = None,
+                      cache: Optional[SubproductCache] = None,
+                      profiler: Optional[KaratsubaProfiler] = None) -> MultiplicationStrategy:
+    karatsuba = KaratsubaMultiplier(base, cutoff_bits, cutoffs, cache, profiler)
+    if strategy == KARATSUBA:
+        return karatsuba
+    if strategy == TOOM3:
+        return ToomCook3Multiplier(cutoff_bits)
+    if strategy == UNBALANCED:
+        return UnbalancedKaratsubaMultiplier(karatsuba)
+    if strategy == SCHOOLBOOK:
+        return SchoolbookMultiplier()
+    if strategy == AUTO:
+        return MultiplierDispatcher(karatsuba)
+    raise ValueError(f"Unknown strategy: {strategy}")
+
+
+class CutoffStore:
+    def __init__(self, path: str = CUTOFF_FILE):
+        self.path = path
+
+    def load(self, base: str) -> Dict[int, int]:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path) as f:
+            table = json.load(f)
+        return {int(c): int(bits) for c, bits in table.get(base, {}).items()}
+
+    def save(self, base: str, cutoffs: Dict[int, int]) -> None:
+        table = {}
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                table = json.load(f)
+        table[base] = {str(c): bits for c, bits in sorted(cutoffs.items())}
+        with open(self.path, "w") as f:
+            json.dump(table, f, indent=2)
+
+
+class CutoffCalibrator:
+    def __init__(self, base: str = BINARY, candidates: Iterable[int] = CUTOFF_CANDIDATES,
+                 repeats: int = 5, seed: int = 0):
+        self.base = base
+        self.candidates = tuple(candidates)
+        self.repeats = repeats
+        self.rng = random.Random(seed)
+
+    def calibrate(self, size_classes: Iterable[int]) -> Dict[int, int]:
+        return {c: self.best_cutoff(c) for c in size_classes}
+
+    def best_cutoff(self, operand_class: int) -> int:
+        bits = 1 << (operand_class - 1)
+        x = self.rng.getrandbits(bits) | (1 << (bits - 1))
+        y = self.rng.getrandbits(bits) | (1 << (bits - 1))
+        timings = {}
+        for cutoff in self.candidates:
+            if cutoff > bits:
+                continue
+            timings[cutoff] = self._time(KaratsubaMultiplier(self.base, cutoff), x, y)
+        return min(timings, key=timings.get)
+
+    def _time(self, multiplier: KaratsubaMultiplier, x: int, y: int) -> float:
+        best = float("inf")
+        for _ in range(self.repeats):
+            start = time.perf_counter()
+            multiplier.multiply(x, y)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+class DecimalCodec:
+    def __init__(self, chunk_digits: int = DECIMAL_CHUNK_DIGITS, chunk_bits: int = DECIMAL_CHUNK_BITS):
+        self.chunk_digits = chunk_digits
+        self.chunk_bits = chunk_bits
+        self._powers_of_ten: List[int] = []
+        self._powers_of_two: List[decimal.Decimal] = []
+
+    def parse(self, text: str) -> int:
+        text = text.strip().replace("_", "")
+        negative = text.startswith("-")
+        digits = text.lstrip("+-") if text[:1] in "+-" else text
+        if len(text) - len(digits) > 1 or not digits.isascii() or not digits.isdigit():
+            raise ValueError(f"Invalid integer literal: {text[:40]!r}")
+        value = self._parse_digits(digits)
+        return -value if negative else value
+
+    def format(self, value: int) -> str:
+        if value < 0:
+            return "-" + self.format(-value)
+        if value.bit_length() <= self.chunk_bits:
+            return str(value)
+        with decimal.localcontext() as context:
+            context.prec = decimal.MAX_PREC
+            context.Emax = decimal.MAX_EMAX
+            context.Emin = decimal.MIN_EMIN
+            context.traps[decimal.Inexact] = True
+            return format(self._to_decimal(value), "f")
+
+    def _parse_digits(self, digits: str) -> int:
+        if len(digits) <= self.chunk_digits:
+            return int(digits)
+        level = 0
+        while self.chunk_digits << (level + 1) < len(digits):
+            level += 1
+        k = self.chunk_digits << level
+        return self._parse_digits(digits[:-k]) * self._power_of_ten(level) + self._parse_digits(digits[-k:])
+
+    def _power_of_ten(self, level: int) -> int:
+        while len(self._powers_of_ten) <= level:
+            if self._powers_of_ten:
+                self._powers_of_ten.append(self._powers_of_ten[-1] ** 2)
+            else:
+                self._powers_of_ten.append(10 ** self.chunk_digits)
+        return self._powers_of_ten[level]
+
+    def _to_decimal(self, value: int) -> decimal.Decimal:
+        bits = value.bit_length()
+        if bits <= self.chunk_bits:
+            return decimal.Decimal(value)
+        level = 0
+        while self.chunk_bits << (level + 1) < bits:
+            level += 1
+        k = self.chunk_bits << level
+        high, low = value >> k, value & ((1 << k) - 1)
+        return self._to_decimal(high) * self._power_of_two(level) + self._to_decimal(low)
+
+    def _power_of_two(self, level: int) -> decimal.Decimal:
+        while len(self._powers_of_two) <= level:
+            if self._powers_of_two:
+                self._powers_of_two.append(self._powers_of_two[-1] * self._powers_of_two[-1])
+            else:
+                self._powers_of_two.append(decimal.Decimal(1 << self.chunk_bits))
+        return self._powers_of_two[level]
+
+
+class OperandFileIO:
+    def __init__(self, codec: Optional[DecimalCodec] = None):
+        self.codec = codec or DecimalCodec()
+
+    def read(self, path: str, operand_format: str = DECIMAL) -> int:
+        if operand_format == RAW:
+            with open(path, "rb") as f:
+                return int.from_bytes(f.read(), "big", signed=True)
+        with open(path) as f:
+            text = f.read()
+        if operand_format == HEX:
+            return int(text.strip(), 16)
+        if operand_format == DECIMAL:
+            return self.codec.parse(text)
+        raise ValueError(f"Unknown operand format: {operand_format}")
+
+    def write(self, path: str, value: int, operand_format: str = DECIMAL) -> None:
+        if operand_format == RAW:
+            with open(path, "wb") as f:
+                f.write(value.to_bytes(value.bit_length() // 8 + 1, "big", signed=True))
+            return
+        if operand_format == HEX:
+            text = format(value, "x")
+        elif operand_format == DECIMAL:
+            text = self.codec.format(value)
+        else:
+            raise ValueError(f"Unknown operand format: {operand_format}")
+        with open(path, "w") as f:
+            f.write(text + "\n")
+
 
 class InputHandler:
+    def __init__(self, codec: Optional[DecimalCodec] = None):
+        self.codec = codec or DecimalCodec()
+
     def get_numbers(self) -> tuple[int, int]:
-        x = int(input("Enter the first integer: "))
-        y = int(input("Enter the second integer: "))
+        x = self.codec.parse(input("Enter the first integer: "))
+        y = self.codec.parse(input("Enter the second integer: "))
         return x, y
 
+    def read_pairs(self, stream: TextIO) -> Iterator[Tuple[int, int]]:
+        for line_number, line in enumerate(stream, 1):
+            fields = line.split()
+            if not fields:
+                continue
+            if len(fields) != 2:
+                raise ValueError(f"Line {line_number}: expected two integers, got {len(fields)} fields")
+            yield self.codec.parse(fields[0]), self.codec.parse(fields[1])
+
 class OutputHandler:
+    def __init__(self, codec: Optional[DecimalCodec] = None):
+        self.codec = codec or DecimalCodec()
+
     def show_result(self, result: int) -> None:
-        print(f"Result: {result}")
+        print(f"Result: {self.codec.format(result)}")
+
+    def write_results(self, results: Iterable[int], stream: TextIO) -> None:
+        for result in results:
+            stream.write(self.codec.format(result) + "\n")
+        stream.flush()
+
+    def write_profile(self, profiler: KaratsubaProfiler, path: str = "-") -> None:
+        if path == "-":
+            print(profiler.to_json(), file=sys.stderr)
+        else:
+            with open(path, "w") as f:
+                f.write(profiler.to_json() + "\n")
+
+    def show_cache_stats(self, stats: Dict[str, int]) -> None:
+        print(f"Cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['entries']} entries, {stats['bytes']} bytes", file=sys.stderr)
 
 class KaratsubaApp:
-    def __init__(self):
-        self.input_handler = InputHandler()
-        self.output_handler = OutputHandler()
-        self.multiplier = KaratsubaMultiplier()
+    def __init__(self, base: str = BINARY, cutoff_bits: Optional[int] = None,
+                 cutoff_file: str = CUTOFF_FILE, strategy: str = KARATSUBA,
+                 workers: Optional[int] = None, parallel_levels: int = 1,
+                 cache_bytes: Optional[int] = None, profile: bool = False):
+        codec = DecimalCodec()
+        self.input_handler = InputHandler(codec)
+        self.output_handler = OutputHandler(codec)
+        self.operand_files = OperandFileIO(codec)
+        self.cache = None if cache_bytes is None else SubproductCache(cache_bytes)
+        self.profiler = KaratsubaProfiler() if profile else None
+        if cutoff_bits is None:
+            self.multiplier = create_multiplier(strategy, base, cutoffs=CutoffStore(cutoff_file).load(base),
+                                                cache=self.cache, profiler=self.profiler)
+        else:
+            self.multiplier = create_multiplier(strategy, base, cutoff_bits, cache=self.cache,
+                                                profiler=self.profiler)
+        self.workers = workers
+        self.parallel_levels = parallel_levels
 
     def run(self):
         x, y = self.input_handler.get_numbers()
-        result = self.multiplier.multiply(x, y)
-        self.output_handler.show_result(result)
+        self.output_handler.show_result(self._multiply(x, y))
+
+    def run_files(self, x_path: str, y_path: str, input_format: str = DECIMAL,
+                  output_path: Optional[str] = None, output_format: str = DECIMAL) -> None:
+        x = self.operand_files.read(x_path, input_format)
+        y = self.operand_files.read(y_path, input_format)
+        result = self._multiply(x, y)
+        if output_path is None:
+            self.output_handler.show_result(result)
+        else:
+            self.operand_files.write(output_path, result, output_format)
+
+    def _multiply(self, x: int, y: int) -> int:
+        if self.workers is None:
+            return self.multiplier.multiply(x, y)
+        with ParallelKaratsubaMultiplier(self.multiplier, self.workers, self.parallel_levels) as multiplier:
+            return multiplier.multiply(x, y)
+
+    def multiply_batch(self, pairs: Iterable[Tuple[int, int]]) -> Iterator[int]:
+        return BatchMultiplier(self.multiplier, self.workers).multiply_all(pairs)
+
+    def run_stream(self, source: str = "-") -> None:
+        if source == "-":
+            self._stream(sys.stdin)
+        else:
+            with open(source) as stream:
+                self._stream(stream)
+
+    def _stream(self, stream: TextIO) -> None:
+        pairs = self.input_handler.read_pairs(stream)
+        self.output_handler.write_results(self.multiply_batch(pairs), sys.stdout)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Karatsuba integer multiplication")
+    parser.add_argument("--base", choices=(BINARY, DECIMAL), default=BINARY,
+                        help="split operands on bit boundaries (binary) or decimal digits (decimal)")
+    parser.add_argument("--strategy", choices=STRATEGIES, default=KARATSUBA,
+                        help="multiplication strategy; 'auto' picks one from the operand sizes")
+    parser.add_argument("--cutoff", type=int, default=None,
+                        help="operand size in bits below which native multiplication is used")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes: splits the top recursion levels, or fans out pairs with --stream")
+    parser.add_argument("--parallel-levels", type=int, choices=(1, 2), default=1,
+                        help="recursion levels sent to the pool: 1 (3 tasks) or 2 (9 tasks)")
+    parser.add_argument("--stream", nargs="?", const="-", default=None, metavar="FILE",
+                        help="multiply newline-delimited 'x y' pairs from FILE (or stdin) and print each product")
+    parser.add_argument("--cache-mb", type=float, default=None,
+                        help="memoize subproducts in an LRU cache with this memory budget in MiB")
+    parser.add_argument("--profile", nargs="?", const="-", default=None, metavar="FILE",
+                        help="record per-level calls, sizes and times and write a JSON report to FILE (or stderr)")
+    parser.add_argument("--x-file", help="read the first operand from this file")
+    parser.add_argument("--y-file", help="read the second operand from this file")
+    parser.add_argument("--input-format", choices=OPERAND_FORMATS, default=DECIMAL,
+                        help="format of the operand files: decimal text, hex text or raw big-endian binary")
+    parser.add_argument("--output-file", help="write the product to this file instead of stdout")
+    parser.add_argument("--output-format", choices=OPERAND_FORMATS, default=DECIMAL,
+                        help="format of the output file")
+    parser.add_argument("--cutoff-file", default=CUTOFF_FILE,
+                        help="file where calibrated cutoffs are stored and loaded from")
+    parser.add_argument("--calibrate", action="store_true",
+                        help="benchmark this machine and save the best cutoff per operand size class")
+    parser.add_argument("--calibrate-min-bits", type=int, default=1 << 9,
+                        help="smallest operand size in bits used during calibration")
+    parser.add_argument("--calibrate-max-bits", type=int, default=1 << 16,
+                        help="largest operand size in bits used during calibration")
+    args = parser.parse_args()
+    if (args.x_file is None) != (args.y_file is None):
+        parser.error("--x-file and --y-file must be given together")
+    return args
+
+def calibrate(args):
+    classes = range(args.calibrate_min_bits.bit_length(), args.calibrate_max_bits.bit_length() + 1)
+    cutoffs = CutoffCalibrator(args.base).calibrate(classes)
+    CutoffStore(args.cutoff_file).save(args.base, cutoffs)
+    for operand_class, bits in sorted(cutoffs.items()):
+        print(f"Operands up to {1 << operand_class} bits: cutoff {bits} bits")
+    print(f"Cutoffs saved to {args.cutoff_file}")
 
 if __name__ == "__main__":
-    app = KaratsubaApp()
-    app.run()
+    args = parse_args()
+    if args.calibrate:
+        calibrate(args)
+    else:
+        cache_bytes = None if args.cache_mb is None else int(args.cache_mb * 1024 * 1024)
+        app = KaratsubaApp(args.base, args.cutoff, args.cutoff_file, args.strategy,
+                           args.workers, args.parallel_levels, cache_bytes, args.profile is not None)
+        if args.stream is not None:
+            app.run_stream(args.stream)
+        elif args.x_file is not None:
+            app.run_files(args.x_file, args.y_file, args.input_format,
+                          args.output_file, args.output_format)
+        else:
+            app.run()
+        if app.cache is not None:
+            app.output_handler.show_cache_stats(app.cache.stats())
+        if app.profiler is not None:
+            app.output_handler.write_profile(app.profiler, args.profile)
@@ -0,0 +1,198 @@
+import argparse
+import array
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from main import SELECTORS, MaxMinSelector, ParallelMaxMinSelector
+
+RANDOM = "random"
+SORTED = "sorted"
+REVERSED = "reversed"
+DUPLICATES = "duplicates"
+DISTRIBUTIONS = (RANDOM, SORTED, REVERSED, DUPLICATES)
+
+DEFAULT_SIZES = (10, 100, 10 ** 4, 10 ** 6)
+DEFAULT_REPEATS = 5
+DEFAULT_BUDGET_SECONDS = 10.0
+BUFFER_SELECTORS = ("buffer", "parallel")
+PARALLEL = "parallel"
+DEFAULT_PARALLEL_THRESHOLD = 10 ** 4
+
+
+def comparison_bound(n: int) -> int:
+    return max(0, math.ceil(3 * n / 2) - 2)
+
+
+class InputGenerator:
+    def __init__(self, seed: int = 0):
+        self.rng = random.Random(seed)
+
+    def numbers(self, n: int, distribution: str) -> List[int]:
+        if distribution == DUPLICATES:
+            return [self.rng.randint(0, 3) for _ in range(n)]
+        numbers = [self.rng.randint(-2 ** 62, 2 ** 62) for _ in range(n)]
+        if distribution == SORTED:
+            numbers.sort()
+        elif distribution == REVERSED:
+            numbers.sort(reverse=True)
+        return numbers
+
+
+class BenchmarkRunner:
+    def __init__(self, repeats: int = DEFAULT_REPEATS, budget_seconds: float = DEFAULT_BUDGET_SECONDS):
+        self.repeats = repeats
+        self.budget_seconds = budget_seconds
+
+    def time_selector(self, selector: MaxMinSelector, numbers) -> List[float]:
+        samples = []
+        for _ in range(self.repeats):
+            start = time.perf_counter()
+            selector.find_max_min(numbers)
+            samples.append(time.perf_counter() - start)
+            if sum(samples) > self.budget_seconds:
+                break
+        return samples
+
+    def peak_memory(self, selector: MaxMinSelector, numbers) -> int:
+        tracemalloc.start()
+        try:
+            selector.find_max_min(numbers)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+
+class MaxMinBenchmark:
+    def __init__(self, sizes: Tuple[int, ...] = DEFAULT_SIZES,
+                 distributions: Tuple[str, ...] = DISTRIBUTIONS,
+                 selectors: Tuple[str, ...] = tuple(SELECTORS),
+                 runner: Optional[BenchmarkRunner] = None, seed: int = 0,
+                 parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD):
+        self.sizes = sizes
+        self.distributions = distributions
+        self.selectors = selectors
+        self.runner = runner or BenchmarkRunner()
+        self.seed = seed
+        self.parallel_threshold = parallel_threshold
+
+    def run(self, progress: Optional[Callable[[Dict[str, object]], None]] = None) -> Dict[str, object]:
+        generator = InputGenerator(self.seed)
+        results = []
+        over_budget = set()
+        for n in self.sizes:
+            for distribution in self.distributions:
+                numbers = generator.numbers(n, distribution)
+                typed = array.array("q", numbers)
+                expected = (min(numbers), max(numbers))
+                for name in self.selectors:
+                    if name in over_budget:
+                        row = {"size": n, "distribution": distribution, "selector": name, "skipped": True}
+                    else:
+                        data = typed if name in BUFFER_SELECTORS else numbers
+                        row = self._measure(name, data, n, distribution, expected)
+                        if row["median"] * row["runs"] > self.runner.budget_seconds:
+                            over_budget.add(name)
+                    results.append(row)
+                    if progress is not None:
+                        progress(row)
+        return {"environment": self.environment(), "results": results}
+
+    def environment(self) -> Dict[str, object]:
+        return {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "repeats": self.runner.repeats,
+            "seed": self.seed,
+            "parallel_threshold": self.parallel_threshold,
+        }
+
+    def create_selector(self, name: str) -> MaxMinSelector:
+        if name == PARALLEL:
+            return ParallelMaxMinSelector(threshold=self.parallel_threshold)
+        return SELECTORS[name]()
+
+    def _measure(self, name: str, numbers, n: int, distribution: str,
+                 expected: Tuple[int, int]) -> Dict[str, object]:
+        selector = self.create_selector(name)
+        result = selector.find_max_min(numbers)
+        correct = (result.minimum, result.maximum) == expected
+        comparisons = selector.get_comparison_count()
+        bound = comparison_bound(n)
+
+        samples = self.runner.time_selector(selector, numbers)
+        median = statistics.median(samples)
+        return {
+            "size": n,
+            "distribution": distribution,
+            "selector": name,
+            "skipped": False,
+            "correct": correct,
+            "comparisons": comparisons,
+            "bound": bound,
+            "within_bound": comparisons <= bound,
+            "runs": len(samples),
+            "median": median,
+            "elements_per_second": n / median if median else None,
+            "parent_peak_bytes": self.runner.peak_memory(selector, numbers),
+        }
+
+
+class BenchmarkReporter:
+    @staticmethod
+    def header() -> str:
+        return (f"{'size':>10} {'distribution':<11} {'selector':<15} {'elem/s':>12} {'parent KiB':>10} "
+                f"{'comparisons':>12} {'bound':>12} {'check':<10}")
+
+    @staticmethod
+    def format_row(row: Dict[str, object]) -> str:
+        prefix = f"{row['size']:>10} {row['distribution']:<11} {row['selector']:<15}"
+        if row["skipped"]:
+            return f"{prefix} skipped (over budget at a smaller size)"
+        if not row["correct"]:
+            check = "WRONG"
+        elif row["within_bound"]:
+            check = "ok"
+        else:
+            check = "over bound"
+        rate = row["elements_per_second"]
+        rate_text = f"{rate:>12.0f}" if rate is not None else f"{'-':>12}"
+        return (f"{prefix} {rate_text} {row['parent_peak_bytes'] / 1024:>10.1f} "
+                f"{row['comparisons']:>12} {row['bound']:>12} {check:<10}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark and verify MaxMin selectors")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="input sizes, up to 10^8 elements")
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument("--selectors", nargs="+", choices=sorted(SELECTORS), default=sorted(SELECTORS))
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS,
+                        help="seconds per case; selectors over budget are skipped at larger sizes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--parallel-threshold", type=int, default=DEFAULT_PARALLEL_THRESHOLD,
+                        help="input size from which the parallel selector shards across processes")
+    parser.add_argument("--json", metavar="FILE", help="write machine-readable results to FILE")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    benchmark = MaxMinBenchmark(tuple(args.sizes), tuple(args.distributions), tuple(args.selectors),
+                                BenchmarkRunner(args.repeats, args.budget), args.seed, args.parallel_threshold)
+    print(BenchmarkReporter.header())
+    report = benchmark.run(lambda row: print(BenchmarkReporter.format_row(row), flush=True))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results saved to {args.json}")
+    if any(not row["skipped"] and not row["correct"] for row in report["results"]):
+        sys.exit(1)
@@ -1,20 +1,80 @@
-from typing import List, Tuple
+import argparse
+import array
+import math
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Iterable, Iterator, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+DEFAULT_BLOCK_SIZE = 1 << 16
+BUFFER_FORMATS = tuple("bBhHiIlLqQnNefd?")
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_READ_BYTES = 1 << 22
+DEFAULT_PARALLEL_THRESHOLD = 1 << 20
+TEXT_FORMAT = "text"
+INT64_FORMAT = "int64"
+
+
+def pairwise_comparisons(n: int) -> int:
+    return 3 * ((n - 1) // 2) + (0 if n % 2 else 1)
+
 
 class MaxMinResult:
+    __slots__ = ("minimum", "maximum")
+    
     def __init__(self, minimum: int, maximum: int):
         self.minimum = minimum
         self.maximum = maximum
     
     def __str__(self):
         return f"Min: {self.minimum}, Max: {self.maximum}"
+    
+    def merge(self, other: "MaxMinResult") -> "MaxMinResult":
+        minimum = other.minimum if other.minimum < self.minimum else self.minimum
+        maximum = other.maximum if other.maximum > self.maximum else self.maximum
+        return MaxMinResult(minimum, maximum)
+
+
+class SummaryStatistics:
+    __slots__ = ("minimum", "maximum", "argmin", "argmax", "count", "total")
+    
+    def __init__(self, minimum: int, maximum: int, argmin: int, argmax: int, count: int, total: int):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.argmin = argmin
+        self.argmax = argmax
+        self.count = count
+        self.total = total
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count
+    
+    def to_max_min(self) -> MaxMinResult:
+        return MaxMinResult(self.minimum, self.maximum)
+    
+    def __str__(self):
+        return (f"Min: {self.minimum} (index {self.argmin}), Max: {self.maximum} (index {self.argmax}), "
+                f"Count: {self.count}, Sum: {self.total}, Mean: {self.mean}")
 
 
 class MaxMinSelector(ABC):
     @abstractmethod
     def find_max_min(self, numbers: List[int]) -> MaxMinResult:
         pass
+    
+    def get_comparison_count(self) -> int:
+        return 0
 
 
 class DivideConquerMaxMinSelector(MaxMinSelector):
@@ -26,34 +86,645 @@ class DivideConquerMaxMinSelector(MaxMinSelector):
             raise ValueError("List cannot be empty")
         
         self.comparison_count = 0
-        result = self._max_min_recursive(numbers, 0, len(numbers) - 1)
-        return result
+        minimum, maximum = self._max_min_recursive(numbers, 0, len(numbers) - 1)
+        return MaxMinResult(minimum, maximum)
     
-    def _max_min_recursive(self, numbers: List[int], low: int, high: int) -> MaxMinResult:
+    def _max_min_recursive(self, numbers: List[int], low: int, high: int) -> Tuple[int, int]:
         if low == high:
-            return MaxMinResult(numbers[low], numbers[high])
+            return numbers[low], numbers[high]
         
         if high == low + 1:
             self.comparison_count += 1
             if numbers[low] > numbers[high]:
-                return MaxMinResult(numbers[high], numbers[low])
+                return numbers[high], numbers[low]
             else:
-                return MaxMinResult(numbers[low], numbers[high])
+                return numbers[low], numbers[high]
         
         mid = (low + high) // 2
-        left_result = self._max_min_recursive(numbers, low, mid)
-        right_result = self._max_min_recursive(numbers, mid + 1, high)
+        left_min, left_max = self._max_min_recursive(numbers, low, mid)
+        right_min, right_max = self._max_min_recursive(numbers, mid + 1, high)
         
         self.comparison_count += 2
-        final_min = min(left_result.minimum, right_result.minimum)
-        final_max = max(left_result.maximum, right_result.maximum)
+        final_min = right_min if right_min < left_min else left_min
+        final_max = right_max if right_max > left_max else left_max
+        
+        return final_min, final_max
+    
+    def get_comparison_count(self) -> int:
+        return self.comparison_count
+
+
+class PairwiseMaxMinSelector(MaxMinSelector):
+    def __init__(self):
+        self.comparison_count = 0
+    
+    def find_max_min(self, numbers: List[int]) -> MaxMinResult:
+        if not numbers:
+            raise ValueError("List cannot be empty")
+        
+        n = len(numbers)
+        iterator = iter(numbers)
+        if n % 2:
+            minimum = maximum = next(iterator)
+        else:
+            first = next(iterator)
+            second = next(iterator)
+            if first > second:
+                minimum, maximum = second, first
+            else:
+                minimum, maximum = first, second
+        
+        for a, b in zip(iterator, iterator):
+            if a > b:
+                if b < minimum:
+                    minimum = b
+                if a > maximum:
+                    maximum = a
+            else:
+                if a < minimum:
+                    minimum = a
+                if b > maximum:
+                    maximum = b
+        
+        self.comparison_count = pairwise_comparisons(n)
+        return MaxMinResult(minimum, maximum)
+    
+    def get_comparison_count(self) -> int:
+        return self.comparison_count
+
+
+class BufferMaxMinSelector(MaxMinSelector):
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE, use_numpy: bool = NUMPY_AVAILABLE):
+        if block_size <= 0:
+            raise ValueError("Block size must be positive")
+        if use_numpy and not NUMPY_AVAILABLE:
+            raise ValueError("NumPy is not installed")
+        self.block_size = block_size
+        self.use_numpy = use_numpy
+        self.comparison_count = 0
+        self._fallback = PairwiseMaxMinSelector()
+    
+    def find_max_min(self, numbers) -> MaxMinResult:
+        if isinstance(numbers, (list, tuple)):
+            return self._find_pure_python(numbers)
+        if self.use_numpy:
+            return self._find_vectorized(numbers)
+        return self._find_pure_python(self._as_flat_view(numbers))
+    
+    def _find_vectorized(self, numbers) -> MaxMinResult:
+        if not isinstance(numbers, np.ndarray):
+            numbers = self._as_flat_view(numbers)
+        array = np.asarray(numbers).reshape(-1)
+        if array.size == 0:
+            raise ValueError("List cannot be empty")
+        if array.dtype.kind not in "iufb":
+            raise TypeError(f"Unsupported element type: {array.dtype}")
+        
+        minimum = maximum = None
+        for start in range(0, array.size, self.block_size):
+            block = array[start:start + self.block_size]
+            block_min = block.min()
+            block_max = block.max()
+            if minimum is None or block_min < minimum:
+                minimum = block_min
+            if maximum is None or block_max > maximum:
+                maximum = block_max
+        
+        self.comparison_count = pairwise_comparisons(array.size)
+        return MaxMinResult(minimum.item(), maximum.item())
+    
+    def _find_pure_python(self, numbers) -> MaxMinResult:
+        result = self._fallback.find_max_min(numbers)
+        self.comparison_count = self._fallback.get_comparison_count()
+        return result
+    
+    @staticmethod
+    def _as_flat_view(numbers) -> memoryview:
+        view = memoryview(numbers)
+        if view.ndim > 1:
+            view = view.cast("B").cast(view.format)
+        if view.format.lstrip("@") not in BUFFER_FORMATS:
+            raise TypeError(f"Unsupported buffer format: {view.format}")
+        return view
+    
+    def get_comparison_count(self) -> int:
+        return self.comparison_count
+
+
+class StreamingMaxMinSelector(MaxMinSelector):
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, chunk_selector: Optional[MaxMinSelector] = None):
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        self.chunk_size = chunk_size
+        self.chunk_selector = chunk_selector or BufferMaxMinSelector()
+        self.comparison_count = 0
+        self._result = None
+    
+    def find_max_min(self, numbers: Iterable[int]) -> MaxMinResult:
+        return self.find_max_min_chunks(NumberFileReader.chunked(numbers, self.chunk_size))
+    
+    def find_max_min_chunks(self, chunks: Iterable) -> MaxMinResult:
+        self._start()
+        for chunk in chunks:
+            self._accumulate(chunk)
+        return self._finish()
+    
+    def find_max_min_file(self, path: str, file_format: str = TEXT_FORMAT) -> MaxMinResult:
+        if file_format == TEXT_FORMAT:
+            return self.find_max_min_chunks(NumberFileReader.read_text_chunks(path, self.chunk_size))
+        if file_format != INT64_FORMAT:
+            raise ValueError(f"Unknown file format: {file_format}")
+        
+        self._start()
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size % 8:
+                raise ValueError("Binary int64 file size must be a multiple of 8 bytes")
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as raw, raw.cast("q") as values:
+                        for start in range(0, len(values), self.chunk_size):
+                            with values[start:start + self.chunk_size] as chunk:
+                                self._accumulate(chunk)
+        return self._finish()
+    
+    def _start(self):
+        self._result = None
+        self.comparison_count = 0
+    
+    def _accumulate(self, chunk):
+        if not len(chunk):
+            return
+        partial = self.chunk_selector.find_max_min(chunk)
+        self.comparison_count += self.chunk_selector.get_comparison_count()
+        if self._result is None:
+            self._result = partial
+        else:
+            self._result = self._result.merge(partial)
+            self.comparison_count += 2
+    
+    def _finish(self) -> MaxMinResult:
+        if self._result is None:
+            raise ValueError("List cannot be empty")
+        result, self._result = self._result, None
+        return result
+    
+    def get_comparison_count(self) -> int:
+        return self.comparison_count
+
+
+def _shard_max_min(shm_name: str, typecode: str, start: int, stop: int) -> Tuple[int, int, int]:
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        with shm.buf.cast(typecode) as values, values[start:stop] as shard:
+            selector = BufferMaxMinSelector()
+            result = selector.find_max_min(shard)
+            return result.minimum, result.maximum, selector.get_comparison_count()
+    finally:
+        shm.close()
+
+
+class ParallelMaxMinSelector(MaxMinSelector):
+    def __init__(self, workers: Optional[int] = None, shards: Optional[int] = None,
+                 threshold: int = DEFAULT_PARALLEL_THRESHOLD, copy_chunk: int = DEFAULT_CHUNK_SIZE):
+        self.workers = workers or os.cpu_count() or 1
+        self.shards = shards or self.workers
+        self.threshold = threshold
+        self.copy_chunk = copy_chunk
+        self.comparison_count = 0
+    
+    def find_max_min(self, numbers) -> MaxMinResult:
+        if not len(numbers):
+            raise ValueError("List cannot be empty")
+        if len(numbers) < self.threshold:
+            return self._find_serial(numbers)
+        
+        try:
+            shm, typecode, n = self._share(numbers)
+        except (TypeError, OverflowError):
+            return self._find_serial(numbers)
+        try:
+            shard_size = -(-n // self.shards)
+            bounds = [(start, min(start + shard_size, n)) for start in range(0, n, shard_size)]
+            with ProcessPoolExecutor(self.workers) as pool:
+                futures = [pool.submit(_shard_max_min, shm.name, typecode, start, stop)
+                           for start, stop in bounds]
+                partials = [future.result() for future in futures]
+        finally:
+            shm.close()
+            shm.unlink()
+        
+        result = None
+        comparisons = 0
+        for minimum, maximum, shard_comparisons in partials:
+            comparisons += shard_comparisons
+            if result is None:
+                result = MaxMinResult(minimum, maximum)
+            else:
+                result = result.merge(MaxMinResult(minimum, maximum))
+                comparisons += 2
+        self.comparison_count = comparisons
+        return result
+    
+    def _find_serial(self, numbers) -> MaxMinResult:
+        serial = BufferMaxMinSelector()
+        result = serial.find_max_min(numbers)
+        self.comparison_count = serial.get_comparison_count()
+        return result
+    
+    def _share(self, numbers) -> Tuple[shared_memory.SharedMemory, str, int]:
+        if isinstance(numbers, (list, tuple)):
+            typecode = "q"
+            n = len(numbers)
+            shm = shared_memory.SharedMemory(create=True, size=n * 8)
+            try:
+                with shm.buf.cast(typecode) as values:
+                    for start in range(0, n, self.copy_chunk):
+                        block = array.array(typecode, numbers[start:start + self.copy_chunk])
+                        values[start:start + len(block)] = block
+            except BaseException:
+                shm.close()
+                shm.unlink()
+                raise
+            return shm, typecode, n
+        
+        with BufferMaxMinSelector._as_flat_view(numbers) as view:
+            typecode = view.format.lstrip("@")
+            shm = shared_memory.SharedMemory(create=True, size=max(view.nbytes, 1))
+            try:
+                with view.cast("B") as raw:
+                    shm.buf[:view.nbytes] = raw
+            except BaseException:
+                shm.close()
+                shm.unlink()
+                raise
+            return shm, typecode, len(view)
+    
+    def get_comparison_count(self) -> int:
+        return self.comparison_count
+
+
+class MaxMinSegmentTree:
+    def __init__(self, numbers: Iterable[int] = ()):
+        values = list(numbers)
+        self._size = len(values)
+        self._capacity = 1
+        while self._capacity < self._size:
+            self._capacity *= 2
+        self._build(values)
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __getitem__(self, index: int) -> int:
+        return self._mins[self._capacity + self._check_index(index)]
+    
+    def update(self, index: int, value: int):
+        position = self._capacity + self._check_index(index)
+        self._mins[position] = value
+        self._maxs[position] = value
+        self._propagate(position)
+    
+    def append(self, value: int):
+        if self._size == self._capacity:
+            values = [self._mins[self._capacity + i] for i in range(self._size)]
+            self._capacity *= 2
+            self._build(values)
+        self._size += 1
+        self.update(self._size - 1, value)
+    
+    def pop(self) -> int:
+        if not self._size:
+            raise IndexError("pop from empty tree")
+        position = self._capacity + self._size - 1
+        value = self._mins[position]
+        self._mins[position] = float("inf")
+        self._maxs[position] = float("-inf")
+        self._propagate(position)
+        self._size -= 1
+        return value
+    
+    def query(self, low: int, high: int) -> MaxMinResult:
+        if not 0 <= low <= high < self._size:
+            raise IndexError(f"Invalid range [{low}, {high}] for size {self._size}")
         
-        return MaxMinResult(final_min, final_max)
+        minimum = float("inf")
+        maximum = float("-inf")
+        left = low + self._capacity
+        right = high + self._capacity + 1
+        while left < right:
+            if left & 1:
+                minimum = min(minimum, self._mins[left])
+                maximum = max(maximum, self._maxs[left])
+                left += 1
+            if right & 1:
+                right -= 1
+                minimum = min(minimum, self._mins[right])
+                maximum = max(maximum, self._maxs[right])
+            left //= 2
+            right //= 2
+        return MaxMinResult(minimum, maximum)
+    
+    def result(self) -> MaxMinResult:
+        if not self._size:
+            raise ValueError("List cannot be empty")
+        return MaxMinResult(self._mins[1], self._maxs[1])
+    
+    def _build(self, values: List[int]):
+        self._mins = [float("inf")] * (2 * self._capacity)
+        self._maxs = [float("-inf")] * (2 * self._capacity)
+        self._mins[self._capacity:self._capacity + len(values)] = values
+        self._maxs[self._capacity:self._capacity + len(values)] = values
+        for position in range(self._capacity - 1, 0, -1):
+            self._mins[position] = min(self._mins[2 * position], self._mins[2 * position + 1])
+            self._maxs[position] = max(self._maxs[2 * position], self._maxs[2 * position + 1])
+    
+    def _propagate(self, position: int):
+        position //= 2
+        while position:
+            self._mins[position] = min(self._mins[2 * position], self._mins[2 * position + 1])
+            self._maxs[position] = max(self._maxs[2 * position], self._maxs[2 * position + 1])
+            position //= 2
+    
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("index out of range")
+        return index
+
+
+class SlidingWindowMaxMin:
+    def __init__(self, window: int):
+        if window <= 0:
+            raise ValueError("Window size must be positive")
+        self.window = window
+        self._count = 0
+        self._mins = deque()
+        self._maxs = deque()
+    
+    def push(self, value: int) -> Optional[MaxMinResult]:
+        index = self._count
+        self._count += 1
+        
+        while self._mins and self._mins[-1][1] >= value:
+            self._mins.pop()
+        self._mins.append((index, value))
+        while self._maxs and self._maxs[-1][1] <= value:
+            self._maxs.pop()
+        self._maxs.append((index, value))
+        
+        oldest = index - self.window + 1
+        if self._mins[0][0] < oldest:
+            self._mins.popleft()
+        if self._maxs[0][0] < oldest:
+            self._maxs.popleft()
+        
+        if self._count < self.window:
+            return None
+        return MaxMinResult(self._mins[0][1], self._maxs[0][1])
+    
+    def windows(self, numbers: Iterable[int]) -> Iterator[MaxMinResult]:
+        for number in numbers:
+            result = self.push(number)
+            if result is not None:
+                yield result
+
+
+class StatisticsAggregator:
+    def __init__(self):
+        self.comparison_count = 0
+    
+    def aggregate(self, numbers: Iterable[int]) -> SummaryStatistics:
+        iterator = iter(numbers)
+        try:
+            first = next(iterator)
+        except StopIteration:
+            raise ValueError("List cannot be empty") from None
+        
+        minimum = maximum = total = first
+        argmin = argmax = 0
+        count = 1
+        comparisons = 0
+        for value in iterator:
+            total += value
+            comparisons += 1
+            if value < minimum:
+                minimum = value
+                argmin = count
+            else:
+                comparisons += 1
+                if value > maximum:
+                    maximum = value
+                    argmax = count
+            count += 1
+        
+        self.comparison_count = comparisons
+        return SummaryStatistics(minimum, maximum, argmin, argmax, count, total)
+    
+    def get_comparison_count(self) -> int:
+        return self.comparison_count
+
+
+class OrderStatisticSelector(MaxMinSelector):
+    def __init__(self):
+        self.comparison_count = 0
+    
+    def find_max_min(self, numbers: List[int]) -> MaxMinResult:
+        selector = PairwiseMaxMinSelector()
+        result = selector.find_max_min(numbers)
+        self.comparison_count = selector.get_comparison_count()
+        return result
+    
+    @abstractmethod
+    def select(self, numbers: List[int], k: int) -> int:
+        pass
     
     def get_comparison_count(self) -> int:
         return self.comparison_count
 
 
+class IntroSelectSelector(OrderStatisticSelector):
+    SMALL_SIZE = 5
+    
+    def select(self, numbers: List[int], k: int) -> int:
+        return self.select_many(numbers, [k])[0]
+    
+    def select_many(self, numbers: List[int], ks: Iterable[int]) -> List[int]:
+        ks = list(ks)
+        n = len(numbers)
+        if not n:
+            raise ValueError("List cannot be empty")
+        for k in ks:
+            if not 0 <= k < n:
+                raise IndexError(f"Rank {k} out of range for {n} elements")
+        
+        self.comparison_count = 0
+        found = {}
+        stack = [(list(numbers), sorted(set(ks)), 0, 2 * n.bit_length())]
+        while stack:
+            values, ranks, offset, depth = stack.pop()
+            if len(values) <= self.SMALL_SIZE:
+                ordered = self._insertion_sort(values)
+                for rank in ranks:
+                    found[rank] = ordered[rank - offset]
+                continue
+            
+            pivot = self._median_of_medians(values) if depth <= 0 else self._median_of_three(values)
+            lows, highs, equal = self._partition(values, pivot)
+            low_end = offset + len(lows)
+            high_start = low_end + equal
+            low_ranks = [rank for rank in ranks if rank < low_end]
+            high_ranks = [rank for rank in ranks if rank >= high_start]
+            for rank in ranks:
+                if low_end <= rank < high_start:
+                    found[rank] = pivot
+            if low_ranks:
+                stack.append((lows, low_ranks, offset, depth - 1))
+            if high_ranks:
+                stack.append((highs, high_ranks, high_start, depth - 1))
+        return [found[k] for k in ks]
+    
+    def _partition(self, values: List[int], pivot: int) -> Tuple[List[int], List[int], int]:
+        lows = []
+        highs = []
+        equal = 0
+        comparisons = 0
+        for value in values:
+            comparisons += 1
+            if value < pivot:
+                lows.append(value)
+            else:
+                comparisons += 1
+                if value > pivot:
+                    highs.append(value)
+                else:
+                    equal += 1
+        self.comparison_count += comparisons
+        return lows, highs, equal
+    
+    def _median_of_three(self, values: List[int]) -> int:
+        return self._insertion_sort([values[0], values[len(values) // 2], values[-1]])[1]
+    
+    def _median_of_medians(self, values: List[int]) -> int:
+        medians = [self._insertion_sort(values[i:i + 5])[(min(5, len(values) - i) - 1) // 2]
+                   for i in range(0, len(values), 5)]
+        if len(medians) <= self.SMALL_SIZE:
+            return self._insertion_sort(medians)[(len(medians) - 1) // 2]
+        
+        comparisons = self.comparison_count
+        pivot = self.select(medians, (len(medians) - 1) // 2)
+        self.comparison_count += comparisons
+        return pivot
+    
+    def _insertion_sort(self, values: List[int]) -> List[int]:
+        ordered = list(values)
+        comparisons = 0
+        for i in range(1, len(ordered)):
+            current = ordered[i]
+            j = i - 1
+            while j >= 0:
+                comparisons += 1
+                if ordered[j] <= current:
+                    break
+                ordered[j + 1] = ordered[j]
+                j -= 1
+            ordered[j + 1] = current
+        self.comparison_count += comparisons
+        return ordered
+
+
+class HeapTopKSelector(OrderStatisticSelector):
+    def select(self, numbers: List[int], k: int) -> int:
+        if not 0 <= k < len(numbers):
+            raise IndexError(f"Rank {k} out of range for {len(numbers)} elements")
+        return self.smallest(numbers, k + 1)[-1]
+    
+    def smallest(self, numbers: Iterable[int], k: int) -> List[int]:
+        return self._top_k(numbers, k, largest=False)
+    
+    def largest(self, numbers: Iterable[int], k: int) -> List[int]:
+        return self._top_k(numbers, k, largest=True)
+    
+    def _top_k(self, numbers: Iterable[int], k: int, largest: bool) -> List[int]:
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        self.comparison_count = 0
+        if k == 0:
+            return []
+        
+        heap = []
+        for value in numbers:
+            if len(heap) < k:
+                heap.append(value)
+                self._sift_up(heap, len(heap) - 1, largest)
+            else:
+                self.comparison_count += 1
+                if (value > heap[0]) if largest else (value < heap[0]):
+                    heap[0] = value
+                    self._sift_down(heap, 0, largest)
+        
+        ordered = []
+        while heap:
+            last = heap.pop()
+            if heap:
+                ordered.append(heap[0])
+                heap[0] = last
+                self._sift_down(heap, 0, largest)
+            else:
+                ordered.append(last)
+        ordered.reverse()
+        return ordered
+    
+    def _before(self, a: int, b: int, largest: bool) -> bool:
+        self.comparison_count += 1
+        return a < b if largest else a > b
+    
+    def _sift_up(self, heap: List[int], position: int, largest: bool):
+        while position:
+            parent = (position - 1) // 2
+            if not self._before(heap[position], heap[parent], largest):
+                break
+            heap[position], heap[parent] = heap[parent], heap[position]
+            position = parent
+    
+    def _sift_down(self, heap: List[int], position: int, largest: bool):
+        size = len(heap)
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and self._before(heap[child + 1], heap[child], largest):
+                child += 1
+            if not self._before(heap[child], heap[position], largest):
+                break
+            heap[position], heap[child] = heap[child], heap[position]
+            position = child
+
+
+class QuantileSelector(IntroSelectSelector):
+    def quantiles(self, numbers: List[int], fractions: Iterable[float]) -> List[int]:
+        n = len(numbers)
+        ranks = []
+        for fraction in fractions:
+            if not 0 <= fraction <= 1:
+                raise ValueError(f"Quantile {fraction} must be between 0 and 1")
+            ranks.append(max(0, math.ceil(round(fraction * n, 9)) - 1))
+        return self.select_many(numbers, ranks)
+    
+    def percentiles(self, numbers: List[int], percents: Iterable[float]) -> List[int]:
+        return self.quantiles(numbers, [percent / 100 for percent in percents])
+
+
+SELECTORS = {
+    "divide-conquer": DivideConquerMaxMinSelector,
+    "pairwise": PairwiseMaxMinSelector,
+    "buffer": BufferMaxMinSelector,
+    "streaming": StreamingMaxMinSelector,
+    "parallel": ParallelMaxMinSelector,
+}
+
+
 class InputHandler:
     @staticmethod
     def get_numbers() -> List[int]:
@@ -70,11 +741,53 @@ class InputHandler:
             return InputHandler.get_numbers()
 
 
+class NumberFileReader:
+    @staticmethod
+    def chunked(numbers: Iterable[int], chunk_size: int) -> Iterator[List[int]]:
+        chunk = []
+        for number in numbers:
+            chunk.append(number)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    
+    @staticmethod
+    def read_text_chunks(path: str, chunk_size: int,
+                         read_bytes: int = DEFAULT_READ_BYTES) -> Iterator[List[int]]:
+        with open(path, "rb") as f:
+            pending = b""
+            chunk = []
+            while True:
+                block = f.read(read_bytes)
+                if not block:
+                    break
+                tokens = (pending + block).split()
+                pending = b""
+                if tokens and not block[-1:].isspace():
+                    pending = tokens.pop()
+                chunk.extend(map(int, tokens))
+                while len(chunk) >= chunk_size:
+                    yield chunk[:chunk_size]
+                    del chunk[:chunk_size]
+            if pending:
+                chunk.append(int(pending))
+            while chunk:
+                yield chunk[:chunk_size]
+                del chunk[:chunk_size]
+
+
 class OutputHandler:
     @staticmethod
     def show_result(result: MaxMinResult, comparison_count: int):
         print(f"\nResult: {result}")
         print(f"Number of comparisons: {comparison_count}")
+    
+    @staticmethod
+    def show_statistics(statistics: SummaryStatistics, comparison_count: int):
+        print(f"\nStatistics: {statistics}")
+        print(f"Number of comparisons: {comparison_count}")
 
 
 class MaxMinApp:
@@ -87,15 +800,49 @@ class MaxMinApp:
         
         numbers = InputHandler.get_numbers()
         result = self.selector.find_max_min(numbers)
-        
-        comparison_count = 0
-        if isinstance(self.selector, DivideConquerMaxMinSelector):
-            comparison_count = self.selector.get_comparison_count()
+        comparison_count = self.selector.get_comparison_count()
         
         OutputHandler.show_result(result, comparison_count)
+    
+    def run_statistics(self):
+        print("MaxMin Select Algorithm - Single-pass Statistics")
+        print("=" * 50)
+        
+        numbers = InputHandler.get_numbers()
+        aggregator = StatisticsAggregator()
+        statistics = aggregator.aggregate(numbers)
+        OutputHandler.show_statistics(statistics, aggregator.get_comparison_count())
+    
+    def run_file(self, path: str, file_format: str = TEXT_FORMAT, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if isinstance(self.selector, StreamingMaxMinSelector):
+            streaming = self.selector
+        else:
+            streaming = StreamingMaxMinSelector(chunk_size, self.selector)
+        result = streaming.find_max_min_file(path, file_format)
+        OutputHandler.show_result(result, streaming.get_comparison_count())
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="MaxMin Select")
+    parser.add_argument("--selector", choices=sorted(SELECTORS), default="divide-conquer",
+                        help="algorithm used to find the minimum and maximum")
+    parser.add_argument("--stats", action="store_true",
+                        help="report min, max, argmin, argmax, count, sum and mean in one pass")
+    parser.add_argument("--file", help="stream numbers from this file instead of reading a line from stdin")
+    parser.add_argument("--format", choices=(TEXT_FORMAT, INT64_FORMAT), default=TEXT_FORMAT,
+                        help="whitespace-separated text or raw native-endian int64 (memory-mapped)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="numbers processed per chunk when streaming a file")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    selector = DivideConquerMaxMinSelector()
+    args = parse_args()
+    selector = SELECTORS[args.selector]()
     app = MaxMinApp(selector)
-    app.run()
+    if args.stats:
+        app.run_statistics()
+    elif args.file is None:
+        app.run()
+    else:
+        app.run_file(args.file, args.format, args.chunk_size)